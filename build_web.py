@@ -79,14 +79,15 @@ def build_web():
             if dist_dir.exists():
                 print(f"📁 出力ディレクトリ: {dist_dir}")
                 
-                # 生成されたファイル一覧
-                files = list(dist_dir.glob("*"))
-                if files:
-                    print("📄 生成されたファイル:")
-                    for file in files[:10]:  # 最初の10ファイルのみ表示
-                        print(f"  - {file.name}")
-                    if len(files) > 10:
-                        print(f"  ... 他 {len(files) - 10} ファイル")
+                # 生成されたファイル一覧（DirEntryのみで名前を取得し、まとめて出力）
+                with os.scandir(dist_dir) as entries:
+                    names = [entry.name for entry in entries]
+                if names:
+                    lines = ["📄 生成されたファイル:"]
+                    lines.extend(f"  - {name}" for name in names[:10])  # 最初の10ファイルのみ表示
+                    if len(names) > 10:
+                        lines.append(f"  ... 他 {len(names) - 10} ファイル")
+                    print("\n".join(lines))
                 
                 # index.html確認
                 index_path = dist_dir / "index.html"
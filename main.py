@@ -23,6 +23,8 @@ def is_web_environment():
 
 import pygame
 
+from src.utils.frame_pacer import FramePacer
+
 class Game:
     def __init__(self):
         pygame.init()
@@ -31,7 +33,7 @@ class Game:
         if is_web_environment():
             os.environ['WEB_VERSION'] = '1'
             try:
-                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=1024)
+                pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
             except:
                 pass
         else:
@@ -40,10 +42,13 @@ class Game:
         self.screen = pygame.display.set_mode((1280, 720))
         pygame.display.set_caption("Mystery Pet Rescue")
         
-        self.clock = pygame.time.Clock()
+        self.clock = pygame.time.Clock()  # FPS計測用
         self.running = True
         self.fps = 30 if is_web_environment() else 60
         
+        # フレームタイミング
+        self.pacer = FramePacer(self.fps)
+        
         # ゲームフロー初期化
         self.game_flow = None
         self.initialize_game()
@@ -58,6 +63,11 @@ class Game:
             print(f"❌ ゲーム初期化エラー: {e}")
             return False
     
+    def _frame_delta(self) -> float:
+        """前フレームからの経過時間（秒）を取得"""
+        self.clock.tick()
+        return self.pacer.delta()
+    
     async def run_async(self):
         """非同期ゲームループ（Web版）"""
         print("🌐 Web版ゲーム開始")
@@ -79,8 +89,15 @@ class Game:
                     except:
                         pass
             
+            # タブが非表示の間は更新・描画を止めて待機
+            if not pygame.display.get_active():
+                await asyncio.sleep(0.25)
+                # 復帰時に停止時間がtime_deltaへ乗らないよう基準をリセット
+                self.pacer.reset()
+                continue
+            
             # 更新
-            time_delta = self.clock.tick(self.fps) / 1000.0
+            time_delta = self._frame_delta()
             try:
                 result = self.game_flow.update(time_delta)
                 if result == "quit":
@@ -96,7 +113,7 @@ class Game:
                 pass
             
             pygame.display.flip()
-            await asyncio.sleep(0)
+            await asyncio.sleep(max(0, self.pacer.advance()) / 1_000_000_000)
     
     def run_sync(self):
         """同期ゲームループ（デスクトップ版）"""
@@ -129,7 +146,8 @@ class Game:
                 break
             
             # 更新
-            time_delta = self.clock.tick(self.fps) / 1000.0
+            self.pacer.wait()
+            time_delta = self._frame_delta()
             try:
                 result = self.game_flow.update(time_delta)
                 if result == "quit":
@@ -158,10 +176,9 @@ class Game:
         
         try:
             # ゲームフローの音声システムを停止
-            if self.game_flow and hasattr(self.game_flow, 'audio_system'):
+            if self.game_flow:
                 print("🔇 音声システム停止中...")
-                self.game_flow.audio_system.stop_bgm()
-                self.game_flow.audio_system.stop_all_sfx()
+                self.game_flow.stop_audio()
         except Exception as e:
             print(f"⚠️ 音声停止エラー: {e}")
         
@@ -196,8 +213,7 @@ class Game:
             self.screen.blit(text, text_rect)
             
             pygame.display.flip()
-            self.clock.tick(30)
-            await asyncio.sleep(0)
+            await asyncio.sleep(max(0, self.pacer.advance()) / 1_000_000_000)
 
 async def main():
     print("🎮 ミステリー・ペット・レスキュー")
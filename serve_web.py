@@ -35,12 +35,13 @@ def serve_web(port=8000, directory="build/web"):
         print(f"❌ index.htmlが見つかりません: {index_path}")
         print("Web版のビルドが完了していない可能性があります")
         
-        # ファイル一覧を表示
-        files = list(dist_path.glob("*"))
-        if files:
-            print(f"📁 {dist_path} の内容:")
-            for file in files:
-                print(f"  - {file.name}")
+        # ファイル一覧を表示（DirEntryのみで名前を取得し、まとめて出力）
+        with os.scandir(dist_path) as entries:
+            names = [entry.name for entry in entries]
+        if names:
+            lines = [f"📁 {dist_path} の内容:"]
+            lines.extend(f"  - {name}" for name in names)
+            print("\n".join(lines))
         return
     
     print("🌐 Web版テストサーバー起動")
@@ -62,12 +63,21 @@ def serve_web(port=8000, directory="build/web"):
         
         # CORS対応のカスタムハンドラー
         class CORSHTTPRequestHandler(handler):
+            # CORSヘッダーは固定なので、エンコード済みのバイト列として一度だけ構築
+            CORS_HEADERS = (
+                b"Cross-Origin-Embedder-Policy: require-corp\r\n"
+                b"Cross-Origin-Opener-Policy: same-origin\r\n"
+                b"Access-Control-Allow-Origin: *\r\n"
+                b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+                b"Access-Control-Allow-Headers: *\r\n"
+            )
+            
             def end_headers(self):
-                self.send_header('Cross-Origin-Embedder-Policy', 'require-corp')
-                self.send_header('Cross-Origin-Opener-Policy', 'same-origin')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-                self.send_header('Access-Control-Allow-Headers', '*')
+                # send_headerと同じヘッダーバッファへ一括で追加（HTTP/0.9はヘッダーなし）
+                if self.request_version != 'HTTP/0.9':
+                    if not hasattr(self, '_headers_buffer'):
+                        self._headers_buffer = []
+                    self._headers_buffer.append(self.CORS_HEADERS)
                 super().end_headers()
             
             def log_message(self, format, *args):
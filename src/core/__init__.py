@@ -6,6 +6,6 @@
 
 from .game import Game
 from .scene import Scene
-from .animation import Animation
+from .animation import Animation, AnimationManager
 
-__all__ = ['Game', 'Scene', 'Animation']
+__all__ = ['Game', 'Scene', 'Animation', 'AnimationManager']
@@ -5,104 +5,271 @@
 
 import pygame
 import math
-from typing import Tuple, Optional
+import random
+from array import array
+from typing import List, Tuple, Optional
 from abc import ABC, abstractmethod
 
+from src.utils.performance_optimizer import batch_blit
+from src.utils.font_manager import get_font_manager
+
+# 補間・イージング関数
+
+def _lerp(start: float, end: float, t: float) -> float:
+    """線形補間"""
+    return start + (end - start) * t
+
+def _ease_out_cubic(t: float) -> float:
+    """イージング関数（ease-out）"""
+    return 1.0 - (1.0 - t) ** 3
+
+def _ease_in_out_sine(t: float) -> float:
+    """イージング関数（ease-in-out）"""
+    return 0.5 * (1.0 - math.cos(t * math.pi))
+
+def _bounce_wave(t: float) -> float:
+    """減衰するバウンス波形（-1.0〜1.0）"""
+    return math.sin(t * math.pi * 4.0) * (1.0 - t)
+
+def _pulse_wave(t: float) -> float:
+    """パルス波形（0.0〜1.0）"""
+    return math.sin(t * math.pi * 6.0) * 0.5 + 0.5
+
+# ease()で指定するイージング種別
+EASE_LINEAR = 0
+EASE_OUT_CUBIC = 1
+EASE_IN_OUT_SINE = 2
+
+def ease(kind: int, t: float) -> float:
+    """種別を指定してイージングを適用（画面遷移など、他モジュールからの利用向け）"""
+    if kind == EASE_OUT_CUBIC:
+        return _ease_out_cubic(t)
+    if kind == EASE_IN_OUT_SINE:
+        return _ease_in_out_sine(t)
+    return t
+
+# _pulse_waveの周期数（進捗0.0〜1.0の間に3周期）
+_PULSE_CYCLES = 3
+
+# 毎フレーム使うイージング値のルックアップテーブル（進捗を量子化して参照）
+_EASING_LUT_SIZE = 1024
+_EASING_LUT_MAX_INDEX = _EASING_LUT_SIZE - 1
+_EASE_IN_OUT_LUT = [_ease_in_out_sine(i / _EASING_LUT_MAX_INDEX) for i in range(_EASING_LUT_SIZE)]
+_BOUNCE_LUT = [_bounce_wave(i / _EASING_LUT_MAX_INDEX) for i in range(_EASING_LUT_SIZE)]
+
+# フレームLUTの最大枚数（事前生成するサーフェス数の上限）
+_MAX_LUT_FRAMES = 64
+
+def _lut_frame_count(duration: float) -> int:
+    """フレームLUTの枚数を決定（60FPS相当、8〜64枚）"""
+    return max(8, min(_MAX_LUT_FRAMES, int(duration * 60)))
+
+def _centered_blit_pos(frame: pygame.Surface, position: Tuple[int, int]) -> Tuple[int, int]:
+    """フレームをpositionに中央揃えで描画する左上座標"""
+    width, height = frame.get_size()
+    return (position[0] - width // 2, position[1] - height // 2)
+
+def _build_scaled_frames(surface: pygame.Surface, scales: list,
+                         position: Tuple[int, int]) -> Tuple[list, list]:
+    """各スケールのサーフェスと中央揃えの描画座標を事前生成（サイズ0のフレームはNone）"""
+    frames = []
+    blit_positions = []
+    width, height = surface.get_size()
+    for scale in scales:
+        new_size = (int(width * scale), int(height * scale))
+        if new_size[0] > 0 and new_size[1] > 0:
+            frame = pygame.transform.scale(surface, new_size)
+            frames.append(frame)
+            blit_positions.append(_centered_blit_pos(frame, position))
+        else:
+            frames.append(None)
+            blit_positions.append(None)
+    return frames, blit_positions
+
+def _build_text_scale_frames(text_surface: pygame.Surface, frame_count: int) -> list:
+    """テキストを0倍から等倍まで拡大したフレームを生成（サイズ0のフレームはNone）"""
+    # 事前生成なので補間品質の高いsmoothscaleを使用
+    # （アンチエイリアス描画の文字はRGBが一様なので、乗算済みアルファにしなくても縁が暗くならない）
+    if text_surface.get_bitsize() >= 24:
+        scale_func = pygame.transform.smoothscale
+    else:
+        scale_func = pygame.transform.scale
+    width, height = text_surface.get_size()
+    frames = []
+    for i in range(frame_count):
+        scale = i / (frame_count - 1)
+        new_size = (int(width * scale), int(height * scale))
+        if new_size[0] > 0 and new_size[1] > 0:
+            frames.append(scale_func(text_surface, new_size))
+        else:
+            frames.append(None)
+    return frames
+
+# パーティクルのフェード段階数（寿命を量子化し、段階ごとのアルファ値で描画済みスプライトを用意）
+_PARTICLE_FADE_STEPS = 8
+
+# パーティクル用スプライトキャッシュ（(色, 半径, フェード段階) → 円を描画済みのサーフェス）
+_particle_sprites = {}
+
+def _pack_rgb(color) -> int:
+    """RGB色を0xRRGGBBの整数にまとめる"""
+    return (color[0] << 16) | (color[1] << 8) | color[2]
+
+def _get_particle_sprite(packed_color: int, radius: int, fade_step: int) -> pygame.Surface:
+    """パーティクル用の円スプライトを取得（初回のみ描画）"""
+    key = (packed_color, radius, fade_step)
+    sprite = _particle_sprites.get(key)
+    if sprite is None:
+        alpha = round(255 * (fade_step + 1) / _PARTICLE_FADE_STEPS)
+        color = ((packed_color >> 16) & 0xFF, (packed_color >> 8) & 0xFF, packed_color & 0xFF, alpha)
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        _particle_sprites[key] = sprite
+    return sprite
+
+# フェード段階ごとのスプライト表のキャッシュ（(使用色, 最大半径) → 段階ごとの {色 << 3 | 半径: スプライト}）
+_particle_sprite_tables = {}
+
+def _get_particle_sprite_tables(colors: frozenset, max_radius: int) -> list:
+    """フェード段階ごとのスプライト表を取得（初回のみ生成）"""
+    key = (colors, max_radius)
+    tables = _particle_sprite_tables.get(key)
+    if tables is None:
+        radii = range(1, max_radius + 1)
+        tables = [
+            {(color << 3) | radius: _get_particle_sprite(color, radius, fade_step)
+             for color in colors for radius in radii}
+            for fade_step in range(_PARTICLE_FADE_STEPS)
+        ]
+        _particle_sprite_tables[key] = tables
+    return tables
+
+# パーティクルの半径の候補
+_PARTICLE_SIZES = range(2, 7)
+# パーティクルに掛かる重力加速度（px/s^2）
+_PARTICLE_GRAVITY = 200.0
+
+def _step_particles(x, y, vx, vy, time_delta, gravity):
+    """パーティクルの位置・速度を1ステップ進める"""
+    for i in range(len(x)):
+        x[i] += vx[i] * time_delta
+        y[i] += vy[i] * time_delta
+        vy[i] += gravity * time_delta
+
 class Animation(ABC):
     """アニメーション基底クラス"""
     
+    __slots__ = ('duration', 'elapsed_time', 'is_finished')
+    
     def __init__(self, duration: float):
         self.duration = duration
         self.elapsed_time = 0.0
         self.is_finished = False
     
-    @abstractmethod
     def update(self, time_delta: float) -> bool:
-        """アニメーション更新（継続中はTrue、終了時はFalse）"""
-        self.elapsed_time += time_delta
-        if self.elapsed_time >= self.duration:
+        """アニメーション更新（継続中はTrue、終了時はFalse）
+        
+        経過時間を進め、進捗率をstepへ渡す。サブクラスはstepのみを実装する
+        """
+        if self.is_finished:
+            return False
+        elapsed_time = self.elapsed_time + time_delta
+        self.elapsed_time = elapsed_time
+        if elapsed_time >= self.duration:
             self.is_finished = True
             return False
+        self.step(elapsed_time / self.duration)
         return True
     
+    def step(self, progress: float) -> None:
+        """進捗率に応じた状態更新（updateから呼ばれる）"""
+        pass
+    
     @abstractmethod
+    def collect_blits(self) -> list:
+        """現フレームで描画する(サーフェス, 位置)の列を取得"""
+        pass
+    
     def draw(self, surface: pygame.Surface) -> None:
         """アニメーション描画"""
-        pass
+        blit_sequence = self.collect_blits()
+        if blit_sequence:
+            batch_blit(surface, blit_sequence)
     
     def get_progress(self) -> float:
         """進捗率取得（0.0-1.0）"""
         return min(1.0, self.elapsed_time / self.duration)
 
 class FadeAnimation(Animation):
-    """フェードアニメーション"""
+    """フェードアニメーション
+    
+    既定では渡されたサーフェスを複製し、複製側のアルファ値を書き換える。
+    呼び出し元がサーフェスを他で使わない場合のみown_surface=Falseで複製を省略できる
+    （その場合は渡したサーフェスのアルファ値が書き換わる）
+    """
+    
+    __slots__ = ('surface', 'position', 'fade_in', 'original_alpha', '_last_alpha')
     
     def __init__(self, surface: pygame.Surface, position: Tuple[int, int], 
-                 duration: float, fade_in: bool = True):
+                 duration: float, fade_in: bool = True, own_surface: bool = True):
         super().__init__(duration)
-        self.surface = surface.copy()
+        self.surface = surface.copy() if own_surface else surface
         self.position = position
         self.fade_in = fade_in
         self.original_alpha = surface.get_alpha() or 255
+        # 最後に設定したアルファ値（同値の再設定を省略）
+        self._last_alpha = -1
     
-    def update(self, time_delta: float) -> bool:
-        if not super().update(time_delta):
-            return False
-        
-        progress = self.get_progress()
+    def step(self, progress: float) -> None:
         if self.fade_in:
             alpha = int(self.original_alpha * progress)
         else:
             alpha = int(self.original_alpha * (1.0 - progress))
         
-        self.surface.set_alpha(alpha)
-        return True
+        if alpha != self._last_alpha:
+            self.surface.set_alpha(alpha)
+            self._last_alpha = alpha
     
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.blit(self.surface, self.position)
+    def collect_blits(self) -> list:
+        return [(self.surface, self.position)]
 
 class ScaleAnimation(Animation):
     """スケールアニメーション"""
     
+    __slots__ = ('original_surface', 'position', 'start_scale', 'end_scale',
+                 '_frames', '_blit_pos', '_frame_index', 'current_surface')
+    
     def __init__(self, surface: pygame.Surface, position: Tuple[int, int],
                  duration: float, start_scale: float = 0.0, end_scale: float = 1.0):
         super().__init__(duration)
-        self.original_surface = surface.copy()
+        self.original_surface = surface  # フレーム生成時に読むだけなので複製しない
         self.position = position
         self.start_scale = start_scale
         self.end_scale = end_scale
-        self.current_surface = surface
-    
-    def update(self, time_delta: float) -> bool:
-        if not super().update(time_delta):
-            return False
-        
-        progress = self.get_progress()
-        # イージング関数（ease-out）
-        eased_progress = 1 - (1 - progress) ** 3
-        
-        current_scale = self.start_scale + (self.end_scale - self.start_scale) * eased_progress
         
-        if current_scale > 0:
-            original_size = self.original_surface.get_size()
-            new_size = (int(original_size[0] * current_scale), 
-                       int(original_size[1] * current_scale))
-            
-            if new_size[0] > 0 and new_size[1] > 0:
-                self.current_surface = pygame.transform.scale(self.original_surface, new_size)
-        
-        return True
-    
-    def draw(self, surface: pygame.Surface) -> None:
-        if self.current_surface:
-            # 中央揃えで描画
-            rect = self.current_surface.get_rect()
-            rect.center = self.position
-            surface.blit(self.current_surface, rect)
+        # イージング（ease-out）適用済みのスケールでフレームを事前生成
+        frame_count = _lut_frame_count(duration)
+        scales = [_lerp(start_scale, end_scale, _ease_out_cubic(i / (frame_count - 1)))
+                  for i in range(frame_count)]
+        self._frames, self._blit_pos = _build_scaled_frames(self.original_surface, scales, position)
+        self._frame_index = 0
+        self.current_surface = self._frames[0]
+    
+    def step(self, progress: float) -> None:
+        self._frame_index = int(progress * (len(self._frames) - 1))
+        self.current_surface = self._frames[self._frame_index]
+    
+    def collect_blits(self) -> list:
+        if not self.current_surface:
+            return []
+        # 中央揃えで描画
+        return [(self.current_surface, self._blit_pos[self._frame_index])]
 
 class SlideAnimation(Animation):
     """スライドアニメーション"""
     
+    __slots__ = ('surface', 'start_pos', 'end_pos', 'current_pos')
+    
     def __init__(self, surface: pygame.Surface, start_pos: Tuple[int, int],
                  end_pos: Tuple[int, int], duration: float):
         super().__init__(duration)
@@ -111,27 +278,23 @@ class SlideAnimation(Animation):
         self.end_pos = end_pos
         self.current_pos = start_pos
     
-    def update(self, time_delta: float) -> bool:
-        if not super().update(time_delta):
-            return False
-        
-        progress = self.get_progress()
+    def step(self, progress: float) -> None:
         # イージング関数（ease-in-out）
-        eased_progress = 0.5 * (1 - math.cos(progress * math.pi))
+        eased_progress = _EASE_IN_OUT_LUT[int(progress * _EASING_LUT_MAX_INDEX)]
         
         self.current_pos = (
-            int(self.start_pos[0] + (self.end_pos[0] - self.start_pos[0]) * eased_progress),
-            int(self.start_pos[1] + (self.end_pos[1] - self.start_pos[1]) * eased_progress)
+            int(_lerp(self.start_pos[0], self.end_pos[0], eased_progress)),
+            int(_lerp(self.start_pos[1], self.end_pos[1], eased_progress))
         )
-        
-        return True
     
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.blit(self.surface, self.current_pos)
+    def collect_blits(self) -> list:
+        return [(self.surface, self.current_pos)]
 
 class BounceAnimation(Animation):
     """バウンスアニメーション"""
     
+    __slots__ = ('surface', 'base_position', 'bounce_height', 'current_position')
+    
     def __init__(self, surface: pygame.Surface, position: Tuple[int, int],
                  duration: float, bounce_height: int = 20):
         super().__init__(duration)
@@ -140,183 +303,299 @@ class BounceAnimation(Animation):
         self.bounce_height = bounce_height
         self.current_position = position
     
-    def update(self, time_delta: float) -> bool:
-        if not super().update(time_delta):
-            return False
-        
-        progress = self.get_progress()
+    def step(self, progress: float) -> None:
         # バウンス効果（sin波）
-        bounce_offset = int(math.sin(progress * math.pi * 4) * 
-                           self.bounce_height * (1 - progress))
+        bounce_offset = int(_BOUNCE_LUT[int(progress * _EASING_LUT_MAX_INDEX)] * self.bounce_height)
         
         self.current_position = (
             self.base_position[0],
             self.base_position[1] - bounce_offset
         )
-        
-        return True
     
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.blit(self.surface, self.current_position)
+    def collect_blits(self) -> list:
+        return [(self.surface, self.current_position)]
 
 class RotateAnimation(Animation):
     """回転アニメーション"""
     
+    __slots__ = ('original_surface', 'position', 'start_angle', 'end_angle',
+                 '_frames', '_blit_pos', '_frame_index', 'current_surface')
+    
     def __init__(self, surface: pygame.Surface, position: Tuple[int, int],
                  duration: float, start_angle: float = 0, end_angle: float = 360):
         super().__init__(duration)
-        self.original_surface = surface.copy()
+        self.original_surface = surface  # フレーム生成時に読むだけなので複製しない
         self.position = position
         self.start_angle = start_angle
         self.end_angle = end_angle
-        self.current_surface = surface
-    
-    def update(self, time_delta: float) -> bool:
-        if not super().update(time_delta):
-            return False
-        
-        progress = self.get_progress()
-        current_angle = self.start_angle + (self.end_angle - self.start_angle) * progress
         
-        self.current_surface = pygame.transform.rotate(self.original_surface, current_angle)
-        
-        return True
-    
-    def draw(self, surface: pygame.Surface) -> None:
-        # 回転による位置ずれを補正
-        rect = self.current_surface.get_rect()
-        rect.center = self.position
-        surface.blit(self.current_surface, rect)
+        # 回転済みフレームと回転による位置ずれを補正した描画座標を事前生成
+        frame_count = _lut_frame_count(duration)
+        self._frames = []
+        self._blit_pos = []
+        for i in range(frame_count):
+            angle = _lerp(start_angle, end_angle, i / (frame_count - 1))
+            frame = pygame.transform.rotate(self.original_surface, angle)
+            self._frames.append(frame)
+            self._blit_pos.append(_centered_blit_pos(frame, position))
+        self._frame_index = 0
+        self.current_surface = self._frames[0]
+    
+    def step(self, progress: float) -> None:
+        self._frame_index = int(progress * (len(self._frames) - 1))
+        self.current_surface = self._frames[self._frame_index]
+    
+    def collect_blits(self) -> list:
+        return [(self.current_surface, self._blit_pos[self._frame_index])]
 
 class PulseAnimation(Animation):
     """パルスアニメーション"""
     
+    __slots__ = ('original_surface', 'position', 'min_scale', 'max_scale',
+                 '_frames', '_blit_pos', '_frame_index', 'current_surface')
+    
     def __init__(self, surface: pygame.Surface, position: Tuple[int, int],
                  duration: float, min_scale: float = 0.8, max_scale: float = 1.2):
         super().__init__(duration)
-        self.original_surface = surface.copy()
+        self.original_surface = surface  # フレーム生成時に読むだけなので複製しない
         self.position = position
         self.min_scale = min_scale
         self.max_scale = max_scale
-        self.current_surface = surface
-    
-    def update(self, time_delta: float) -> bool:
-        if not super().update(time_delta):
-            return False
-        
-        progress = self.get_progress()
-        # パルス効果（sin波）
-        pulse_factor = math.sin(progress * math.pi * 6) * 0.5 + 0.5
-        current_scale = self.min_scale + (self.max_scale - self.min_scale) * pulse_factor
-        
-        original_size = self.original_surface.get_size()
-        new_size = (int(original_size[0] * current_scale), 
-                   int(original_size[1] * current_scale))
         
-        if new_size[0] > 0 and new_size[1] > 0:
-            self.current_surface = pygame.transform.scale(self.original_surface, new_size)
-        
-        return True
-    
-    def draw(self, surface: pygame.Surface) -> None:
-        rect = self.current_surface.get_rect()
-        rect.center = self.position
-        surface.blit(self.current_surface, rect)
+        # パルス効果（sin波）は周期的なので1周期分のみフレームを事前生成
+        frame_count = _lut_frame_count(duration / _PULSE_CYCLES)
+        scales = [_lerp(min_scale, max_scale, _pulse_wave(i / (frame_count * _PULSE_CYCLES)))
+                  for i in range(frame_count)]
+        self._frames, self._blit_pos = _build_scaled_frames(self.original_surface, scales, position)
+        self._frame_index = 0
+        self.current_surface = self._frames[0]
+    
+    def step(self, progress: float) -> None:
+        frame_count = len(self._frames)
+        self._frame_index = int(progress * _PULSE_CYCLES * frame_count) % frame_count
+        self.current_surface = self._frames[self._frame_index]
+    
+    def collect_blits(self) -> list:
+        if not self.current_surface:
+            return []
+        return [(self.current_surface, self._blit_pos[self._frame_index])]
 
 class TextAnimation(Animation):
     """テキストアニメーション"""
     
+    __slots__ = ('text', 'font', 'color', 'position', 'animation_type', 'text_surface',
+                 '_alpha', '_scaled_frames', '_scaled_pos')
+    
+    # スケール表示用に事前生成するフレーム数
+    SCALE_FRAMES = 32
+    
     def __init__(self, text: str, font: pygame.font.Font, color: Tuple[int, int, int],
-                 position: Tuple[int, int], duration: float, animation_type: str = "fade"):
+                 position: Tuple[int, int], duration: float, animation_type: str = "fade",
+                 text_surface: Optional[pygame.Surface] = None):
         super().__init__(duration)
         self.text = text
         self.font = font
         self.color = color
         self.position = position
         self.animation_type = animation_type
-        self.text_surface = font.render(text, True, color)
-    
-    def update(self, time_delta: float) -> bool:
-        return super().update(time_delta)
-    
-    def draw(self, surface: pygame.Surface) -> None:
+        shared_surface = text_surface is not None
+        if text_surface is None:
+            text_surface = font.render(text, True, color)
+        elif animation_type != "scale":
+            # 描画済みサーフェスは共有されうるので、アルファ値を書き換える場合は複製
+            text_surface = text_surface.copy()
+        self.text_surface = text_surface
+        # 最後に設定したアルファ値（同値の再設定を省略）
+        self._alpha = -1
+        
+        if animation_type == "scale":
+            # 拡大フレームは渡された描画済みサーフェスごとにキャッシュし、描画座標のみインスタンスごとに計算
+            # （その場で描画したサーフェスは使い回されないのでキャッシュしない）
+            if shared_surface:
+                self._scaled_frames = _get_scaled_text_frames(text_surface, self.SCALE_FRAMES)
+            else:
+                self._scaled_frames = _build_text_scale_frames(text_surface, self.SCALE_FRAMES)
+            self._scaled_pos = [_centered_blit_pos(frame, position) if frame is not None else None
+                                for frame in self._scaled_frames]
+    
+    def _set_alpha(self, alpha: int) -> None:
+        """テキストサーフェスのアルファ値を設定（変化時のみ）"""
+        if alpha != self._alpha:
+            self.text_surface.set_alpha(alpha)
+            self._alpha = alpha
+    
+    def collect_blits(self) -> list:
         progress = self.get_progress()
         
         if self.animation_type == "fade":
-            alpha = int(255 * progress)
-            temp_surface = self.text_surface.copy()
-            temp_surface.set_alpha(alpha)
-            surface.blit(temp_surface, self.position)
+            self._set_alpha(int(255 * progress))
+            return [(self.text_surface, self.position)]
         
         elif self.animation_type == "slide_up":
             offset_y = int(50 * (1 - progress))
             pos = (self.position[0], self.position[1] - offset_y)
-            alpha = int(255 * progress)
-            temp_surface = self.text_surface.copy()
-            temp_surface.set_alpha(alpha)
-            surface.blit(temp_surface, pos)
+            self._set_alpha(int(255 * progress))
+            return [(self.text_surface, pos)]
         
         elif self.animation_type == "scale":
-            scale = progress
-            if scale > 0:
-                original_size = self.text_surface.get_size()
-                new_size = (int(original_size[0] * scale), 
-                           int(original_size[1] * scale))
-                if new_size[0] > 0 and new_size[1] > 0:
-                    scaled_surface = pygame.transform.scale(self.text_surface, new_size)
-                    rect = scaled_surface.get_rect()
-                    rect.center = self.position
-                    surface.blit(scaled_surface, rect)
+            index = int(progress * (self.SCALE_FRAMES - 1))
+            scaled_surface = self._scaled_frames[index]
+            if scaled_surface:
+                return [(scaled_surface, self._scaled_pos[index])]
+        
+        return []
 
 class ParticleAnimation(Animation):
     """パーティクルアニメーション"""
     
+    __slots__ = ('position', 'x', 'y', 'vx', 'vy', 'colors', 'sizes', 'life',
+                 '_sprites', '_last_progress')
+    
     def __init__(self, position: Tuple[int, int], duration: float, 
                  particle_count: int = 20, colors: list = None):
         super().__init__(duration)
         self.position = position
-        self.particles = []
         
         if colors is None:
             colors = [(255, 255, 0), (255, 200, 0), (255, 150, 0)]
+        # 色は0xRRGGBBの整数で保持
+        packed_colors = [_pack_rgb(color) for color in colors]
+        
+        # パーティクル初期化（属性ごとの配列で保持、乱数は配列単位でまとめて生成）
+        rand = random.random
+        self.x = array('f', [position[0]]) * particle_count
+        self.y = array('f', [position[1]]) * particle_count
+        self.vx = array('f', [rand() * 200 - 100 for _ in range(particle_count)])
+        self.vy = array('f', [rand() * 100 - 150 for _ in range(particle_count)])
+        self.colors = array('I', random.choices(packed_colors, k=particle_count))
+        self.sizes = array('B', random.choices(_PARTICLE_SIZES, k=particle_count))
+        # 寿命は全パーティクル共通
+        self.life = 1.0
+        self._last_progress = 0.0
         
-        # パーティクル初期化
-        import random
-        for _ in range(particle_count):
-            particle = {
-                'x': position[0],
-                'y': position[1],
-                'vx': random.uniform(-100, 100),
-                'vy': random.uniform(-150, -50),
-                'color': random.choice(colors),
-                'size': random.randint(2, 6),
-                'life': 1.0
-            }
-            self.particles.append(particle)
+        # 描画用スプライトのフェード段階ごとの表（キーは 色 << 3 | 半径 の整数、同じ色・半径の組み合わせで共有）
+        self._sprites = _get_particle_sprite_tables(frozenset(self.colors), max(self.sizes, default=1))
     
-    def update(self, time_delta: float) -> bool:
-        if not super().update(time_delta):
-            return False
+    def step(self, progress: float) -> None:
+        # 前回からの進捗差分を経過時間に換算してパーティクル更新
+        time_delta = (progress - self._last_progress) * self.duration
+        self._last_progress = progress
         
-        # パーティクル更新
-        for particle in self.particles:
-            particle['x'] += particle['vx'] * time_delta
-            particle['y'] += particle['vy'] * time_delta
-            particle['vy'] += 200 * time_delta  # 重力
-            particle['life'] = 1.0 - self.get_progress()
+        _step_particles(self.x, self.y, self.vx, self.vy, time_delta, _PARTICLE_GRAVITY)
+        self.life = 1.0 - progress
+    
+    def collect_blits(self) -> list:
+        life = self.life
+        if life <= 0:
+            return []
         
-        return True
+        # パーティクル描画（寿命に応じてフェード済みの円スプライト）
+        sprites = self._sprites[int(life * (_PARTICLE_FADE_STEPS - 1))]
+        blit_sequence = []
+        for x, y, size, color in zip(self.x, self.y, self.sizes, self.colors):
+            radius = max(1, int(size * life))
+            blit_sequence.append((sprites[(color << 3) | radius], (int(x) - radius, int(y) - radius)))
+        return blit_sequence
+
+class AnimationManager:
+    """アニメーション一括管理クラス
+    
+    継続中のアニメーションを更新し、終了したものは一定フレームごとにまとめて取り除く
+    """
+    
+    # 終了したアニメーションをリストから取り除く間隔（フレーム数）
+    PRUNE_INTERVAL = 30
+    
+    def __init__(self):
+        self.animations: List[Animation] = []
+        self._finished_count = 0
+        self._frames_since_prune = 0
+    
+    def __len__(self) -> int:
+        """継続中のアニメーション数"""
+        return len(self.animations) - self._finished_count
+    
+    def add(self, animation: Animation) -> None:
+        """アニメーションを追加"""
+        if animation.is_finished:
+            return
+        self.animations.append(animation)
+    
+    def extend(self, animations: List[Animation]) -> None:
+        """複数のアニメーションを追加（create_success_animation等の戻り値用）"""
+        for animation in animations:
+            self.add(animation)
+    
+    def clear(self) -> None:
+        """全アニメーションを破棄"""
+        self.animations.clear()
+        self._finished_count = 0
+        self._frames_since_prune = 0
+    
+    def update_all(self, time_delta: float) -> None:
+        """全アニメーションを更新"""
+        if not self.animations:
+            return
+        
+        for animation in self.animations:
+            if not animation.is_finished and not animation.update(time_delta):
+                self._finished_count += 1
+        
+        # 終了済みの除去はリスト再構築を伴うため、一定フレームごとにまとめて行う
+        self._frames_since_prune += 1
+        if self._finished_count and self._frames_since_prune >= self.PRUNE_INTERVAL:
+            self._remove_finished()
     
-    def draw(self, surface: pygame.Surface) -> None:
-        for particle in self.particles:
-            if particle['life'] > 0:
-                alpha = int(255 * particle['life'])
-                color = (*particle['color'], alpha)
-                
-                # パーティクル描画（円）
-                pos = (int(particle['x']), int(particle['y']))
-                pygame.draw.circle(surface, particle['color'], pos, 
-                                 max(1, int(particle['size'] * particle['life'])))
+    def draw_all(self, surface: pygame.Surface, camera_offset: Tuple[int, int] = (0, 0)) -> None:
+        """全アニメーションの描画をまとめて1回のblit呼び出しで行う
+        
+        ワールド座標で作成したアニメーションはcamera_offsetを渡して画面座標に変換する
+        """
+        blit_sequence = []
+        for animation in self.animations:
+            if not animation.is_finished:
+                blit_sequence.extend(animation.collect_blits())
+        if not blit_sequence:
+            return
+        
+        offset_x, offset_y = camera_offset
+        if offset_x or offset_y:
+            blit_sequence = [(blit_surface, (x - offset_x, y - offset_y))
+                             for blit_surface, (x, y) in blit_sequence]
+        batch_blit(surface, blit_sequence)
+    
+    def _remove_finished(self) -> None:
+        """終了したアニメーションを取り除く"""
+        self.animations = [animation for animation in self.animations if not animation.is_finished]
+        self._finished_count = 0
+        self._frames_since_prune = 0
+
+# ファクトリ関数用のキャッシュ（(テキスト, サイズ, 色) → 描画済みサーフェス）
+_text_surfaces = {}
+# スケール表示用のキャッシュ（(描画済みサーフェス, フレーム数) → 拡大段階ごとのフレーム）
+_scaled_text_frames = {}
+
+def _get_font(size: int) -> pygame.font.Font:
+    """日本語対応フォントを取得（FontManagerがサイズごとにキャッシュ）"""
+    return get_font_manager().get_font("default", size)
+
+def _get_text_surface(text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    """描画済みテキストを取得（初回のみ描画）"""
+    key = (text, size, color)
+    text_surface = _text_surfaces.get(key)
+    if text_surface is None:
+        text_surface = _get_font(size).render(text, True, color)
+        _text_surfaces[key] = text_surface
+    return text_surface
+
+def _get_scaled_text_frames(text_surface: pygame.Surface, frame_count: int) -> list:
+    """描画済みテキストの拡大フレームを取得（初回のみ生成）"""
+    key = (text_surface, frame_count)
+    frames = _scaled_text_frames.get(key)
+    if frames is None:
+        frames = _build_text_scale_frames(text_surface, frame_count)
+        _scaled_text_frames[key] = frames
+    return frames
 
 def create_success_animation(position: Tuple[int, int]) -> list:
     """成功時のアニメーション作成"""
@@ -327,9 +606,9 @@ def create_success_animation(position: Tuple[int, int]) -> list:
                                       [(255, 215, 0), (255, 255, 0), (255, 165, 0)]))
     
     # 成功テキスト
-    font = pygame.font.Font(None, 48)
-    animations.append(TextAnimation("成功！", font, (76, 175, 80), 
-                                  position, 1.5, "scale"))
+    color = (76, 175, 80)
+    animations.append(TextAnimation("成功！", _get_font(48), color, position, 1.5, "scale",
+                                    text_surface=_get_text_surface("成功！", 48, color)))
     
     return animations
 
@@ -338,8 +617,8 @@ def create_failure_animation(position: Tuple[int, int]) -> list:
     animations = []
     
     # 失敗テキスト
-    font = pygame.font.Font(None, 48)
-    animations.append(TextAnimation("失敗...", font, (244, 67, 54), 
-                                  position, 1.5, "fade"))
+    color = (244, 67, 54)
+    animations.append(TextAnimation("失敗...", _get_font(48), color, position, 1.5, "fade",
+                                    text_surface=_get_text_surface("失敗...", 48, color)))
     
     return animations
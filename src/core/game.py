@@ -5,8 +5,10 @@
 
 import pygame
 import sys
-import time
-from typing import Dict, List, Optional, Any
+import math
+import threading
+from typing import Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
@@ -27,9 +29,43 @@ class GameState(Enum):
     GAME_OVER = "game_over"
     VICTORY = "victory"
 
+@dataclass
+class Objective:
+    """ゲーム目標"""
+    title: str
+    description: str
+    target: int
+    type: str
+    current: int = 0
+
 class Game:
     """メインゲームクラス"""
     
+    # 差分更新の面積が画面のこの割合を超えたら全体flipに切り替える
+    DIRTY_FLIP_RATIO = 0.5
+    
+    # FPS表示の下地を保存・復元する領域のサイズ（表示位置は画面右上）
+    FPS_AREA_SIZE = (100, 30)
+    
+    # ペットとの相互作用の事前判定に使う距離の2乗
+    INTERACT_R2 = Pet.INTERACT_DISTANCE * Pet.INTERACT_DISTANCE
+    
+    # カメラ追従の速さ（大きいほど早くプレイヤーに追いつく）
+    CAMERA_SPEED = 5.0
+    
+    # 描画済みテキストキャッシュの最大件数
+    TEXT_CACHE_SIZE = 64
+    
+    # 状態に関わらず処理するイベント種別
+    GLOBAL_EVENT_TYPES = (pygame.QUIT, pygame.VIDEORESIZE, pygame.KEYDOWN)
+    
+    # 状態別に追加で処理するイベント種別（登録のない状態では全イベントを取得）
+    STATE_EVENT_TYPES = {
+        GameState.MENU: (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYUP),
+        GameState.PLAYING: (),
+        GameState.PAUSED: (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYUP)
+    }
+    
     def __init__(self):
         # Pygame初期化
         pygame.init()
@@ -38,7 +74,8 @@ class Game:
         # 画面設定
         self.screen_width = 1280
         self.screen_height = 720
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
+        # 画像はディスプレイの画素形式に変換して読み込むため、アセット読み込みより先に作成する
+        self.screen = self._set_display_mode(self.screen_width, self.screen_height)
         pygame.display.set_caption("ミステリー・ペット・レスキュー")
         
         # ゲーム状態
@@ -74,7 +111,8 @@ class Game:
         
         # ペット管理
         self.pets: List[Pet] = []
-        self.rescued_pets: List[Pet] = []
+        self.rescued_pets: Set[Pet] = set()  # 所属判定が多いのでsetで保持
+        self._active_pets: List[Pet] = []  # 未救出のペット（救出時のみ更新）
         
         # 謎解きシステム（削除済み）
         # self.puzzle_system = PuzzleSystem()
@@ -82,32 +120,85 @@ class Game:
         
         # マップシステム
         self.map_system = MapSystem()
+        self.on_map_changed()
         
         # ゲーム進行管理
-        self.game_objectives = []
+        self.game_objectives: List[Objective] = []
         self.current_objective_index = 0
         self.pets_to_rescue = 3  # 救出目標数
         
         # カメラ
         self.camera_x = 0
         self.camera_y = 0
+        self._half_w = self.screen_width // 2
+        self._half_h = self.screen_height // 2
         
-        # ゲーム統計
-        self.game_start_time = time.time()
+        # ゲーム統計（開始時刻はpygame.time.get_ticks()のミリ秒）
+        self.game_start_time_ms = pygame.time.get_ticks()
         self.total_play_time = 0.0
         
         # デバッグ
         self.debug_mode = False
         self.show_fps = True
         
+        # 差分描画（前フレームの更新領域、最後に描画した状態とカメラ位置）
+        self._prev_dirty: List[pygame.Rect] = []
+        self._last_drawn_state = None
+        self._last_camera = None
+        
+        # 描画済みテキストのキャッシュ（(テキスト, サイズ, 色) → サーフェス）
+        self._text_cache: Dict[Tuple[str, int, Tuple[int, int, int]], pygame.Surface] = {}
+        self._fps_value = -1
+        self._fps_surface: Optional[pygame.Surface] = None
+        # FPS表示の下にある画面内容（部分更新時に戻してから描き直す）
+        self._fps_backing: Optional[pygame.Surface] = None
+        
+        # ポーズ画面のオーバーレイ・パネル・テキスト配置（画面サイズ変更時に再構築）
+        self._build_pause_layout()
+        
+        # 状態別の処理テーブル
+        self._event_handlers = {
+            GameState.MENU: self._handle_menu_events,
+            GameState.PLAYING: self._handle_playing_events,
+            GameState.PUZZLE: self._handle_puzzle_events,
+            GameState.PAUSED: self._handle_paused_events
+        }
+        self._update_handlers = {
+            GameState.PLAYING: self._update_playing,
+            GameState.PUZZLE: self._update_puzzle
+        }
+        self._draw_handlers = {
+            GameState.MENU: self._draw_menu,
+            GameState.PLAYING: self._draw_playing,
+            GameState.PUZZLE: self._draw_puzzle,
+            GameState.PAUSED: self._draw_paused
+        }
+        
+        # アセット事前読み込み（タイトル画面を表示している間にバックグラウンドで実行）
+        self._preload_thread = threading.Thread(target=self.asset_manager.preload_all_assets, daemon=True)
+        self._preload_thread.start()
+        
+        # 1フレーム分の更新・描画処理（ゲームプレイ中は状態判定を省いた専用処理）
+        self._tick = self._tick_generic
+        
         print("🎮 メインゲームシステム初期化完了")
     
+    def _set_display_mode(self, width: int, height: int) -> pygame.Surface:
+        """ウィンドウを作成（可能なら垂直同期を有効化）"""
+        try:
+            return pygame.display.set_mode((width, height), pygame.RESIZABLE, vsync=1)
+        except pygame.error:
+            # 垂直同期に対応していない環境では通常のモードで作成
+            return pygame.display.set_mode((width, height), pygame.RESIZABLE)
+    
     def initialize_game(self):
         """ゲーム初期化"""
         print("🔄 ゲーム初期化中...")
         
-        # アセット事前読み込み
-        self.asset_manager.preload_all_assets()
+        # アセット事前読み込みの完了を待つ（通常はタイトル画面の間に終わっている）
+        self._preload_thread.join()
+        # 読み込みスレッドはディスプレイに触れないため、画素形式の変換はここで行う
+        self.asset_manager.convert_loaded_images()
         
         # プレイヤー作成
         self.player = Player(400, 300)
@@ -120,6 +211,7 @@ class Game:
         
         # マップ読み込み（現在は使用されていない - scenes/game.pyで管理）
         # self.map_system.load_map("realistic_city_v1.json")
+        # self.on_map_changed()
         
         # プレイヤー位置をスポーン地点に設定
         spawn_point = self.map_system.get_spawn_point("player")
@@ -161,6 +253,7 @@ class Game:
         for config in pet_configs:
             pet = Pet(config["data"], config["position"][0], config["position"][1])
             self.pets.append(pet)
+        self._active_pets = [pet for pet in self.pets if pet not in self.rescued_pets]
         
         print(f"🐾 ペット生成完了: {len(self.pets)}匹")
     
@@ -182,20 +275,18 @@ class Game:
     def _setup_objectives(self):
         """ゲーム目標を設定"""
         self.game_objectives = [
-            {
-                "title": "ペットを見つけよう",
-                "description": f"迷子のペットを{self.pets_to_rescue}匹見つけて救出する",
-                "target": self.pets_to_rescue,
-                "current": 0,
-                "type": "rescue_pets"
-            },
-            {
-                "title": "すべてのペットを救出",
-                "description": "残りのペットもすべて救出する",
-                "target": len(self.pets),
-                "current": 0,
-                "type": "rescue_all"
-            }
+            Objective(
+                title="ペットを見つけよう",
+                description=f"迷子のペットを{self.pets_to_rescue}匹見つけて救出する",
+                target=self.pets_to_rescue,
+                type="rescue_pets"
+            ),
+            Objective(
+                title="すべてのペットを救出",
+                description="残りのペットもすべて救出する",
+                target=len(self.pets),
+                type="rescue_all"
+            )
         ]
     
     def _setup_game_ui(self):
@@ -216,7 +307,7 @@ class Game:
         # 初期目標設定
         if self.game_objectives:
             obj = self.game_objectives[self.current_objective_index]
-            self.game_ui.set_objective(obj["title"], obj["description"], obj["target"])
+            self.game_ui.set_objective(obj.title, obj.description, obj.target)
         
         # 初期通知
         self.game_ui.add_notification("ゲーム開始！迷子のペットを探しましょう", NotificationType.INFO, 4.0)
@@ -229,20 +320,52 @@ class Game:
             time_delta = self.clock.tick(self.target_fps) / 1000.0
             
             # イベント処理
-            events = pygame.event.get()
+            events = self._poll_events()
             self._handle_events(events)
             
-            # 更新
-            self._update(time_delta)
-            
-            # 描画
-            self._draw()
-            
-            pygame.display.flip()
+            # 更新・描画（状態に応じて_set_stateで差し替えた処理を実行）
+            dirty_rects = self._tick(time_delta)
+            self._present(dirty_rects)
         
         # クリーンアップ
         self._cleanup()
     
+    def _set_state(self, state: GameState):
+        """ゲーム状態を変更し、フレーム処理を状態に合わせて差し替える"""
+        self.current_state = state
+        self._tick = self._tick_playing if state == GameState.PLAYING else self._tick_generic
+    
+    def _tick_generic(self, time_delta: float) -> Optional[List[pygame.Rect]]:
+        """1フレーム分の更新・描画（状態別の処理テーブルを経由）"""
+        self._update(time_delta)
+        return self._draw()
+    
+    def _tick_playing(self, time_delta: float) -> Optional[List[pygame.Rect]]:
+        """ゲームプレイ中の1フレーム分の更新・描画（状態判定なし）"""
+        self._update_playing(time_delta)
+        return self._finish_draw(self._draw_playing())
+    
+    def _poll_events(self) -> List[pygame.event.Event]:
+        """現在の状態で処理するイベントのみ取得
+        
+        対象外のイベントは破棄し、連続したVIDEORESIZEは最後の1件にまとめる
+        """
+        state_event_types = self.STATE_EVENT_TYPES.get(self.current_state)
+        if state_event_types is None:
+            events = pygame.event.get()
+        else:
+            events = pygame.event.get(self.GLOBAL_EVENT_TYPES + state_event_types)
+            # 取得後に届いたイベントを落とさないようpumpせずに破棄
+            pygame.event.clear(pump=False)
+        
+        resize_events = [event for event in events if event.type == pygame.VIDEORESIZE]
+        if len(resize_events) > 1:
+            last_resize = resize_events[-1]
+            events = [event for event in events
+                      if event.type != pygame.VIDEORESIZE or event is last_resize]
+        
+        return events
+    
     def _handle_events(self, events: List[pygame.event.Event]):
         """イベント処理"""
         for event in events:
@@ -251,9 +374,13 @@ class Game:
             
             elif event.type == pygame.VIDEORESIZE:
                 # 解像度変更対応
-                self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                self.screen = self._set_display_mode(event.w, event.h)
                 self.screen_width = event.w
                 self.screen_height = event.h
+                self._half_w = event.w // 2
+                self._half_h = event.h // 2
+                self._last_drawn_state = None
+                self._build_pause_layout()
                 
                 # UI システムに通知
                 if hasattr(self, 'game_ui'):
@@ -264,8 +391,10 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_F1:
                     self.debug_mode = not self.debug_mode
+                    self._last_drawn_state = None  # 表示の消去のため全体を再描画
                 elif event.key == pygame.K_F2:
                     self.show_fps = not self.show_fps
+                    self._last_drawn_state = None
                 elif event.key == pygame.K_ESCAPE:
                     if self.current_state == GameState.PLAYING:
                         self._pause_game()
@@ -275,139 +404,143 @@ class Game:
                         self._resume_game()  # ポーズ中にESCでゲーム再開
         
         # 状態別イベント処理
-        if self.current_state == GameState.MENU:
-            result = self.menu_system.update(0, events)
-            if result == MenuState.GAME:
-                self._start_game()
-            elif result == MenuState.QUIT:
-                self.running = False
-        
-        elif self.current_state == GameState.PLAYING:
-            # ゲーム内UI入力処理
-            for event in events:
-                self.game_ui.handle_input(event)
-        
-        elif self.current_state == GameState.PUZZLE:
-            if self.puzzle_ui:
-                result = self.puzzle_ui.update(0, events)
-                if result == "quit":
-                    self._exit_puzzle()
-        
-        elif self.current_state == GameState.PAUSED:
-            # ポーズメニューの処理
-            result = self.menu_system.update(0, events)
-            if result == MenuState.GAME:
-                self._resume_game()
-            elif result == MenuState.TITLE:
-                self._return_to_menu()
-            elif result == MenuState.QUIT:
-                self.running = False
+        handler = self._event_handlers.get(self.current_state)
+        if handler:
+            handler(events)
+    
+    def _handle_menu_events(self, events: List[pygame.event.Event]):
+        """メニュー画面のイベント処理"""
+        result = self.menu_system.update(0, events)
+        if result == MenuState.GAME:
+            self._start_game()
+        elif result == MenuState.QUIT:
+            self.running = False
+    
+    def _handle_playing_events(self, events: List[pygame.event.Event]):
+        """ゲームプレイ中のイベント処理"""
+        # ゲーム内UI入力処理
+        for event in events:
+            self.game_ui.handle_input(event)
+    
+    def _handle_puzzle_events(self, events: List[pygame.event.Event]):
+        """謎解き中のイベント処理"""
+        if self.puzzle_ui:
+            result = self.puzzle_ui.update(0, events)
+            if result == "quit":
+                self._exit_puzzle()
+    
+    def _handle_paused_events(self, events: List[pygame.event.Event]):
+        """ポーズメニューのイベント処理"""
+        result = self.menu_system.update(0, events)
+        if result == MenuState.GAME:
+            self._resume_game()
+        elif result == MenuState.TITLE:
+            self._return_to_menu()
+        elif result == MenuState.QUIT:
+            self.running = False
     
     def _update(self, time_delta: float):
         """更新処理"""
-        # 総プレイ時間更新
-        if self.current_state == GameState.PLAYING:
-            self.total_play_time += time_delta
-        
         # 状態別更新
-        if self.current_state == GameState.PLAYING:
-            self._update_gameplay(time_delta)
-        elif self.current_state == GameState.PUZZLE:
-            if self.puzzle_ui:
-                self.puzzle_ui.update(time_delta, [])
+        handler = self._update_handlers.get(self.current_state)
+        if handler:
+            handler(time_delta)
+    
+    def _update_playing(self, time_delta: float):
+        """ゲームプレイ中の更新"""
+        # 総プレイ時間更新
+        self.total_play_time += time_delta
+        self._update_gameplay(time_delta)
+    
+    def _update_puzzle(self, time_delta: float):
+        """謎解き中の更新"""
+        if self.puzzle_ui:
+            self.puzzle_ui.update(time_delta, [])
     
     def _update_gameplay(self, time_delta: float):
         """ゲームプレイ更新"""
         if not self.player:
             return
         
-        # キー入力取得
+        # キー入力取得（移動キーの判定はPlayer側でScancodeWrapperを直接参照）
         keys = pygame.key.get_pressed()
-        keys_pressed = set()
-        
-        # 移動キー
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            keys_pressed.add(pygame.K_LEFT)
-            keys_pressed.add(pygame.K_a)
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            keys_pressed.add(pygame.K_RIGHT)
-            keys_pressed.add(pygame.K_d)
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            keys_pressed.add(pygame.K_UP)
-            keys_pressed.add(pygame.K_w)
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            keys_pressed.add(pygame.K_DOWN)
-            keys_pressed.add(pygame.K_s)
-        if keys[pygame.K_LSHIFT]:
-            keys_pressed.add(pygame.K_LSHIFT)
         
         # プレイヤー更新
-        self.player.update(time_delta, keys_pressed, self.map_system)
+        self.player.update(time_delta, keys, self.map_system)
         
         # ペット更新
         player_pos = self.player.get_position()
-        for pet in self.pets:
-            if pet not in self.rescued_pets:
-                pet.update(time_delta, player_pos, self.map_system)
+        for pet in self._active_pets:
+            pet.update(time_delta, player_pos, self.map_system)
         
         # カメラ更新
-        self._update_camera()
+        self._update_camera(time_delta)
         
         # ゲームUI更新
         self.game_ui.update(time_delta)
         
         # ペット救出チェック
-        self._check_pet_interactions()
+        self._check_pet_interactions(keys)
         
         # 目標達成チェック
         self._check_objectives()
     
-    def _update_camera(self):
+    def _update_camera(self, time_delta: float):
         """カメラ更新"""
         if not self.player:
             return
         
         # プレイヤーを中心にカメラ配置
         player_center = self.player.get_center()
-        target_x = player_center[0] - self.screen_width // 2
-        target_y = player_center[1] - self.screen_height // 2
+        target_x = player_center[0] - self._half_w
+        target_y = player_center[1] - self._half_h
         
-        # スムーズなカメラ移動
-        camera_speed = 5.0
-        self.camera_x += (target_x - self.camera_x) * camera_speed * (1/60)
-        self.camera_y += (target_y - self.camera_y) * camera_speed * (1/60)
+        # スムーズなカメラ移動（指数減衰なのでフレームレートに依存しない）
+        follow = 1.0 - math.exp(-self.CAMERA_SPEED * time_delta)
+        self.camera_x += (target_x - self.camera_x) * follow
+        self.camera_y += (target_y - self.camera_y) * follow
         
         # カメラ範囲制限（マップサイズに基づく）
-        world_width, world_height = self.map_system.get_map_size()
+        world_width = self._world_w
+        world_height = self._world_h
         if world_width > 0 and world_height > 0:
             self.camera_x = max(0, min(world_width - self.screen_width, self.camera_x))
             self.camera_y = max(0, min(world_height - self.screen_height, self.camera_y))
     
-    def _check_pet_interactions(self):
-        """ペットとの相互作用チェック"""
-        if not self.player:
+    def on_map_changed(self):
+        """マップ読み込み後に呼ぶ（カメラ制限用のマップサイズを更新）"""
+        self._world_w, self._world_h = self.map_system.get_map_size()
+    
+    def _check_pet_interactions(self, keys: pygame.key.ScancodeWrapper):
+        """ペットとの相互作用チェック（keysはこのフレームのpygame.key.get_pressed()）"""
+        # スペースキーでの相互作用（押されていないフレームではペットを走査しない）
+        if not self.player or not keys[pygame.K_SPACE]:
             return
         
         player_pos = self.player.get_position()
-        
-        for pet in self.pets:
-            if pet in self.rescued_pets:
+        player_x, player_y = player_pos
+        interact_r2 = self.INTERACT_R2
+        
+        # 救出したペットはリストから外すので複製を走査
+        for pet in tuple(self._active_pets):
+            # 距離の2乗で範囲外のペットを先に除外（sqrtやinteractの呼び出しを省く）
+            dx = pet.x - player_x
+            dy = pet.y - player_y
+            if dx * dx + dy * dy >= interact_r2:
                 continue
             
-            # スペースキーでの相互作用
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_SPACE]:
-                if pet.interact(player_pos):
-                    # 救出成功
-                    if pet.rescue():
-                        self.rescued_pets.append(pet)
-                        self.game_ui.add_notification(f"{pet.data.name}を救出しました！", NotificationType.SUCCESS, 3.0)
-                        
-                        # 目標進捗更新
-                        if self.current_objective_index < len(self.game_objectives):
-                            obj = self.game_objectives[self.current_objective_index]
-                            obj["current"] = len(self.rescued_pets)
-                            self.game_ui.update_objective_progress(obj["current"])
+            if pet.interact(player_pos):
+                # 救出成功
+                if pet.rescue():
+                    self.rescued_pets.add(pet)
+                    self._active_pets.remove(pet)
+                    self.game_ui.add_notification(f"{pet.data.name}を救出しました！", NotificationType.SUCCESS, 3.0)
+                    
+                    # 目標進捗更新
+                    if self.current_objective_index < len(self.game_objectives):
+                        obj = self.game_objectives[self.current_objective_index]
+                        obj.current = len(self.rescued_pets)
+                        self.game_ui.update_objective_progress(obj.current)
     
     def _check_objectives(self):
         """目標達成チェック"""
@@ -416,7 +549,7 @@ class Game:
         
         current_obj = self.game_objectives[self.current_objective_index]
         
-        if current_obj["current"] >= current_obj["target"]:
+        if current_obj.current >= current_obj.target:
             # 目標達成
             self.game_ui.add_notification("目標達成！", NotificationType.ACHIEVEMENT, 3.0)
             
@@ -426,61 +559,148 @@ class Game:
             if self.current_objective_index < len(self.game_objectives):
                 # 次の目標設定
                 next_obj = self.game_objectives[self.current_objective_index]
-                self.game_ui.set_objective(next_obj["title"], next_obj["description"], next_obj["target"])
-                self.game_ui.add_notification(f"新しい目標: {next_obj['title']}", NotificationType.INFO, 4.0)
+                self.game_ui.set_objective(next_obj.title, next_obj.description, next_obj.target)
+                self.game_ui.add_notification(f"新しい目標: {next_obj.title}", NotificationType.INFO, 4.0)
             else:
                 # 全目標達成
                 self._game_victory()
     
-    def _draw(self):
-        """描画処理"""
-        # 背景クリア
-        self.screen.fill((50, 100, 50))
+    def _draw(self) -> Optional[List[pygame.Rect]]:
+        """描画処理
         
-        # 状態別描画
-        if self.current_state == GameState.MENU:
-            self.menu_system.draw()
-        
-        elif self.current_state == GameState.PLAYING:
-            self._draw_gameplay()
-        
-        elif self.current_state == GameState.PUZZLE:
-            if self.puzzle_ui:
-                self.puzzle_ui.draw()
+        Returns:
+            前フレームから変化した画面上の領域のリスト（画面全体を更新する場合はNone）
+        """
+        # メニューに変化がなければ描画を丸ごと省略（FPS表示等も前フレームのまま残す）
+        if self.current_state == GameState.MENU and not self._menu_needs_redraw():
+            return []
         
-        elif self.current_state == GameState.PAUSED:
-            # ゲーム画面を暗くして表示
-            self._draw_gameplay()
-            
-            # 半透明オーバーレイ
-            overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            self.screen.blit(overlay, (0, 0))
-            
-            # ポーズメニュー描画
-            self._draw_pause_menu()
+        # 状態別描画
+        return self._finish_draw(self._draw_handlers.get(self.current_state, self._draw_background)())
+    
+    def _menu_needs_redraw(self) -> bool:
+        """メニュー画面を描き直す必要があるか"""
+        if self._last_drawn_state != self.current_state or self.debug_mode:
+            return True
+        if self.show_fps and int(self.clock.get_fps()) != self._fps_value:
+            return True
+        return self.menu_system.needs_redraw()
+    
+    def _finish_draw(self, dirty_rects: Optional[List[pygame.Rect]]) -> Optional[List[pygame.Rect]]:
+        """状態別描画の後処理（デバッグ・FPS表示と差分更新領域の確定）"""
+        # 状態遷移直後やカメラが動いた場合は背景全体が変わる
+        camera = (int(self.camera_x), int(self.camera_y))
+        full_redraw = (dirty_rects is None or self._last_drawn_state != self.current_state or
+                       camera != self._last_camera)
+        self._last_drawn_state = self.current_state
+        self._last_camera = camera
         
         # デバッグ情報
         if self.debug_mode:
-            self._draw_debug_info()
+            debug_rect = self._draw_debug_info()
+            if dirty_rects is not None:
+                dirty_rects.append(debug_rect)
         
         # FPS表示
         if self.show_fps:
-            self._draw_fps()
+            fps_rect = self._draw_fps(full_redraw, dirty_rects)
+            if dirty_rects is not None:
+                dirty_rects.append(fps_rect)
+        
+        if full_redraw:
+            # 全体を更新する場合も、次フレームで消去すべき領域は記録しておく
+            self._prev_dirty = dirty_rects or []
+            return None
+        return dirty_rects
+    
+    def _draw_background(self) -> None:
+        """背景のみ描画"""
+        self.screen.fill((50, 100, 50))
+    
+    def _draw_menu(self) -> Optional[List[pygame.Rect]]:
+        """メニュー画面描画（選択ボタンが変わっただけなら、そのボタンの領域のみ更新）"""
+        # デバッグ表示は下地を描き直さないと重ね描きになるため、表示中は全体を再描画
+        # （FPS表示は_draw_fpsが下地を戻してから描き直す）
+        if self._last_drawn_state == self.current_state and not self.debug_mode:
+            dirty_rects = self.menu_system.draw_selection()
+            if dirty_rects is not None:
+                return dirty_rects
+        
+        self.screen.fill((50, 100, 50))
+        self.menu_system.draw()
+        return None
+    
+    def _draw_playing(self) -> List[pygame.Rect]:
+        """ゲームプレイ中の描画（差分更新用の領域を返す）"""
+        # マップが背景を上書きするので画面クリアは不要
+        if not self.map_system.map_surface:
+            self.screen.fill((50, 100, 50))
+        return self._draw_gameplay()
+    
+    def _draw_puzzle(self) -> None:
+        """謎解き画面描画"""
+        self.screen.fill((50, 100, 50))
+        if self.puzzle_ui:
+            self.puzzle_ui.draw()
     
-    def _draw_gameplay(self):
-        """ゲームプレイ描画"""
+    def _draw_paused(self) -> None:
+        """ポーズ画面描画"""
+        # ゲーム画面を暗くして表示
+        self.screen.fill((50, 100, 50))
+        self._draw_gameplay()
+        
+        # 半透明オーバーレイ
+        self.screen.blit(self._pause_overlay, (0, 0))
+        
+        # ポーズメニュー描画
+        self._draw_pause_menu()
+    
+    def _present(self, dirty_rects: Optional[List[pygame.Rect]]):
+        """描画結果を画面に反映（変化した領域のみ、広すぎる場合は全体flip）"""
+        if dirty_rects is None:
+            pygame.display.flip()
+            return
+        
+        # 前フレームで描いた領域も消去のため更新対象に含める
+        screen_rect = self.screen.get_rect()
+        rects = [rect.clip(screen_rect) for rect in self._prev_dirty + dirty_rects]
+        self._prev_dirty = dirty_rects
+        
+        dirty_area = sum(rect.width * rect.height for rect in rects)
+        if dirty_area > screen_rect.width * screen_rect.height * self.DIRTY_FLIP_RATIO:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+    
+    def _draw_gameplay(self) -> List[pygame.Rect]:
+        """ゲームプレイ描画（マップ以外で描画した領域のリストを返す）"""
+        dirty_rects = []
+        
         # 簡易マップ描画
         self._draw_world()
         
-        # プレイヤー描画
-        if self.player:
-            self.player.draw(self.screen, (self.camera_x, self.camera_y))
+        # プレイヤー・ペット描画（未救出のペットはUI描画でも使う）
+        camera = (self.camera_x, self.camera_y)
+        active_pets = self._active_pets
+        entities = [self.player] + active_pets if self.player else active_pets
+        
+        # スプライトはまとめて描画し、スプライトがないものは個別にフォールバック描画
+        blit_sequence = []
+        sprite_entities = []
+        for entity in entities:
+            blit_args = entity.get_blit_args(camera)
+            if blit_args:
+                blit_sequence.append(blit_args)
+                sprite_entities.append(entity)
+            else:
+                dirty_rects.append(entity.draw(self.screen, camera))
+        dirty_rects.extend(self.screen.blits(blit_sequence))
         
-        # ペット描画
-        for pet in self.pets:
-            if pet not in self.rescued_pets:
-                pet.draw(self.screen, (self.camera_x, self.camera_y))
+        # スタミナバー・エモーションなどの付加表示
+        for entity in sprite_entities:
+            overlay_rect = entity.draw_overlay(self.screen, camera)
+            if overlay_rect:
+                dirty_rects.append(overlay_rect)
         
         # ゲームUI描画
         if self.player:
@@ -491,15 +711,16 @@ class Game:
                 'max_stamina': self.player.stats.max_stamina
             }
             
-            active_pets = [pet for pet in self.pets if pet not in self.rescued_pets]
-            self.game_ui.draw(player_stats, active_pets, self.player.get_position())
+            dirty_rects.extend(self.game_ui.draw(player_stats, active_pets, self.player.get_position()))
+        
+        return dirty_rects
     
     def _draw_world(self):
         """世界描画"""
         # マップシステムで描画
         self.map_system.draw(self.screen, self.camera_x, self.camera_y)
     
-    def _draw_debug_info(self):
+    def _draw_debug_info(self) -> pygame.Rect:
         """デバッグ情報描画"""
         debug_info = [
             f"State: {self.current_state.value}",
@@ -518,32 +739,64 @@ class Game:
         
         # デバッグテキスト
         for i, info in enumerate(debug_info):
-            text_surface = self.font_manager.render_text(info, 14, (255, 255, 255))
+            text_surface = self._render_text(info, 14, (255, 255, 255))
             self.screen.blit(text_surface, (15, 15 + i * 20))
+        
+        return debug_panel
     
-    def _draw_fps(self):
-        """FPS表示"""
-        fps_text = f"FPS: {int(self.clock.get_fps())}"
-        fps_surface = self.font_manager.render_text(fps_text, 16, (255, 255, 0))
-        self.screen.blit(fps_surface, (self.screen_width - 100, 10))
+    def _draw_fps(self, full_redraw: bool, dirty_rects: Optional[List[pygame.Rect]]) -> pygame.Rect:
+        """FPS表示（表示領域を返す）
+        
+        下地が描き直されていないフレーム（メニューの部分更新）では、
+        保存しておいた下地を戻してから描くことで前の表示と重ならないようにする
+        """
+        # 表示値が変わったときのみ再描画
+        fps = int(self.clock.get_fps())
+        if fps != self._fps_value:
+            self._fps_value = fps
+            self._fps_surface = self._render_text(f"FPS: {fps}", 16, (255, 255, 0))
+        
+        area = pygame.Rect((self.screen_width - 100, 10), self.FPS_AREA_SIZE).clip(self.screen.get_rect())
+        # メニュー以外の状態は毎フレーム画面全体を描くので、常に下地が新しい
+        backing_redrawn = (full_redraw or self.current_state != GameState.MENU or
+                           area.collidelist(dirty_rects) != -1)
+        if backing_redrawn or self._fps_backing is None or self._fps_backing.get_size() != area.size:
+            self._fps_backing = self.screen.subsurface(area).copy()
+        else:
+            self.screen.blit(self._fps_backing, area)
+        
+        self.screen.blit(self._fps_surface, area, pygame.Rect((0, 0), area.size))
+        return area
     
-    def _draw_pause_menu(self):
-        """ポーズメニューを描画"""
+    def _render_text(self, text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """テキストを描画（最近使ったものをキャッシュし、上限を超えたら古いものから破棄）"""
+        key = (text, size, color)
+        surface = self._text_cache.pop(key, None)
+        if surface is None:
+            surface = self.font_manager.render_text(text, "default", size, color)
+            if len(self._text_cache) >= self.TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+        # 末尾に入れ直して最近使った順を保つ
+        self._text_cache[key] = surface
+        return surface
+    
+    def _build_pause_layout(self):
+        """ポーズ画面のオーバーレイ、パネル矩形、配置済みテキストを構築"""
+        # 半透明オーバーレイ
+        self._pause_overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA).convert_alpha()
+        self._pause_overlay.fill((0, 0, 0, 128))
+        
         # ポーズメニューパネル
         menu_width = 400
         menu_height = 300
         menu_x = (self.screen_width - menu_width) // 2
         menu_y = (self.screen_height - menu_height) // 2
-        
-        # パネル背景
-        menu_panel = pygame.Rect(menu_x, menu_y, menu_width, menu_height)
-        pygame.draw.rect(self.screen, (50, 50, 50), menu_panel)
-        pygame.draw.rect(self.screen, (255, 255, 255), menu_panel, 3)
+        self._pause_panel_rect = pygame.Rect(menu_x, menu_y, menu_width, menu_height)
+        center_x = self.screen_width // 2
         
         # タイトル
-        title_surface = self.font_manager.render_text("ポーズ", 32, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(self.screen_width // 2, menu_y + 50))
-        self.screen.blit(title_surface, title_rect)
+        title_surface = self._render_text("ポーズ", 32, (255, 255, 255))
+        pause_blits = [(title_surface, title_surface.get_rect(center=(center_x, menu_y + 50)))]
         
         # メニューオプション
         menu_options = [
@@ -554,16 +807,24 @@ class Game:
         ]
         
         for i, option in enumerate(menu_options):
-            option_y = menu_y + 120 + i * 40
-            option_surface = self.font_manager.render_text(option, 20, (255, 255, 255))
-            option_rect = option_surface.get_rect(center=(self.screen_width // 2, option_y))
-            self.screen.blit(option_surface, option_rect)
+            option_surface = self._render_text(option, 20, (255, 255, 255))
+            pause_blits.append((option_surface, option_surface.get_rect(center=(center_x, menu_y + 120 + i * 40))))
         
         # 操作説明
         help_text = "ESC: ゲーム再開 / マウス: メニュー選択"
-        help_surface = self.font_manager.render_text(help_text, 16, (200, 200, 200))
-        help_rect = help_surface.get_rect(center=(self.screen_width // 2, menu_y + menu_height - 30))
-        self.screen.blit(help_surface, help_rect)
+        help_surface = self._render_text(help_text, 16, (200, 200, 200))
+        pause_blits.append((help_surface, help_surface.get_rect(center=(center_x, menu_y + menu_height - 30))))
+        
+        self._pause_blits = pause_blits
+    
+    def _draw_pause_menu(self):
+        """ポーズメニューを描画（配置は_build_pause_layoutで構築済み）"""
+        # パネル背景
+        pygame.draw.rect(self.screen, (50, 50, 50), self._pause_panel_rect)
+        pygame.draw.rect(self.screen, (255, 255, 255), self._pause_panel_rect, 3)
+        
+        # タイトル・メニューオプション・操作説明
+        self.screen.blits(self._pause_blits, doreturn=False)
     
     # ゲーム状態管理メソッド
     def _start_game(self):
@@ -571,46 +832,46 @@ class Game:
         if not self.player:
             self.initialize_game()
         
-        self.current_state = GameState.PLAYING
-        self.game_start_time = time.time()
+        self._set_state(GameState.PLAYING)
+        self.game_start_time_ms = pygame.time.get_ticks()
         print("🎮 ゲーム開始")
     
     def _pause_game(self):
         """ゲーム一時停止"""
-        self.current_state = GameState.PAUSED
+        self._set_state(GameState.PAUSED)
         # ポーズメニューの状態を直接設定
         self.menu_system.current_state = MenuState.PAUSE
         print("⏸️ ゲーム一時停止")
     
     def _resume_game(self):
         """ゲーム再開"""
-        self.current_state = GameState.PLAYING
+        self._set_state(GameState.PLAYING)
         # メニューシステムの状態もリセット
         self.menu_system.current_state = MenuState.GAME
         print("▶️ ゲーム再開")
     
     def _return_to_menu(self):
         """メニューに戻る"""
-        self.current_state = GameState.MENU
+        self._set_state(GameState.MENU)
         self.menu_system.current_state = MenuState.TITLE
         self.menu_system.state_stack.clear()
         print("🏠 メニューに戻る")
     
     def _enter_puzzle(self, puzzle_id: str):
         """謎解きモードに入る"""
-        self.current_state = GameState.PUZZLE
+        self._set_state(GameState.PUZZLE)
         if self.puzzle_ui:
             self.puzzle_ui.start_puzzle(puzzle_id)
         print(f"🧩 謎解き開始: {puzzle_id}")
     
     def _exit_puzzle(self):
         """謎解きモードを終了"""
-        self.current_state = GameState.PLAYING
+        self._set_state(GameState.PLAYING)
         print("🎮 ゲームに戻る")
     
     def _game_victory(self):
         """ゲーム勝利"""
-        self.current_state = GameState.VICTORY
+        self._set_state(GameState.VICTORY)
         self.game_ui.add_notification("おめでとうございます！全てのペットを救出しました！", NotificationType.ACHIEVEMENT, 5.0)
         print("🎉 ゲーム勝利！")
     
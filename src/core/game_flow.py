@@ -4,8 +4,9 @@
 """
 
 import pygame
-import time
-from typing import Dict, Any, Optional
+import logging
+from dataclasses import dataclass, fields, asdict
+from typing import Dict, Any, Optional, List
 from src.core.scene import Scene
 from src.scenes.menu import MenuScene
 from src.scenes.game import GameScene
@@ -13,48 +14,95 @@ from src.scenes.result import ResultScene
 from src.systems.audio_system import AudioSystem
 from src.utils.language_manager import get_text
 
+logger = logging.getLogger(__name__)
+
+@dataclass
+class GameResult:
+    """ゲーム結果データ"""
+    pets_rescued: int = 0
+    total_pets: int = 4
+    time_taken: float = 0.0
+    score: int = 0
+    victory: bool = False
+    game_over: bool = False
+    defeat_reason: Optional[str] = None
+    remaining_time: float = 0.0
+    player_lives: int = 0
+    completion_rate: float = 0.0
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GameResult":
+        """辞書から生成（未知のキーは無視）"""
+        result = cls()
+        result.update(data)
+        return result
+    
+    def update(self, data: Dict[str, Any]):
+        """辞書の値で上書き（未知のキーは無視）"""
+        for f in fields(self):
+            if f.name in data:
+                setattr(self, f.name, data[f.name])
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書に変換（ResultSceneへの受け渡し用）"""
+        return asdict(self)
+
 class GameFlowManager:
     """ゲームフロー管理クラス"""
     
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
         self.current_scene: Optional[Scene] = None
+        self._current_scene_name = "unknown"
         self.scenes: Dict[str, Scene] = {}
         self.running = True
         
         # 音楽システム初期化
         self.audio_system = AudioSystem()
         
-        # ゲーム状態
-        self.game_start_time = 0
-        self.game_result = {
-            'pets_rescued': 0,
-            'total_pets': 4,
-            'time_taken': 0,
-            'score': 0
+        # ゲーム状態（開始時刻はpygame.time.get_ticks()のミリ秒、0は未開始）
+        self.game_start_time_ms = 0
+        self.game_result = GameResult()
+        
+        # このフレームで救出通知されたペットID（フレーム末尾でまとめて集計）
+        self._pending_rescues: List[str] = []
+        
+        # 全ペット救出後の結果画面移行タイマーを設定済みか
+        self._completion_timer_set = False
+        
+        # シーン名ごとの遷移処理（戻り値は再生するBGM名）
+        self._scene_handlers = {
+            "menu": self._enter_menu,
+            "game": self._enter_game,
+            "result": self._enter_result,
         }
         
-        # シーンを初期化
-        self._initialize_scenes()
+        # シーン名ごとの作成処理（シーンは最初に遷移したときに作成する）
+        self._scene_factories = {
+            "menu": self._create_menu_scene,
+            "game": lambda: GameScene(self.screen, self),
+            "result": lambda: ResultScene(self.screen, self.game_result.to_dict()),
+        }
         
         # 最初のシーンを設定
         self.change_scene("menu")
     
+    def stop_audio(self):
+        """BGM・効果音を停止"""
+        self.audio_system.stop_bgm()
+        self.audio_system.stop_all_sfx()  # 全効果音停止
+    
     def update_window_title(self):
         """ウィンドウタイトルを現在の言語に応じて更新"""
         title = get_text("game_title")
         pygame.display.set_caption(title)
-        print(f"🪟 ウィンドウタイトル更新: '{title}'")
+        logger.debug("ウィンドウタイトル更新: '%s'", title)
     
-    def _initialize_scenes(self):
-        """シーンを初期化"""
-        # メニューシーンは常に利用可能
+    def _create_menu_scene(self) -> MenuScene:
+        """メニューシーンを作成"""
         menu_scene = MenuScene(self.screen)
         menu_scene.set_game_flow_manager(self)  # 参照を設定
-        self.scenes["menu"] = menu_scene
-        
-        # ゲームシーンと結果シーンは必要に応じて作成
-        # （ゲーム開始時に最新の状態で作成するため）
+        return menu_scene
     
     def change_scene(self, scene_name: str) -> bool:
         """
@@ -68,10 +116,20 @@ class GameFlowManager:
         """
         if scene_name == "quit":
             self.running = False
-            self.audio_system.stop_bgm()
-            self.audio_system.stop_all_sfx()  # 全効果音停止
+            self.stop_audio()
             return True
         
+        # シーンが存在しない場合はメニューに戻る
+        if scene_name not in self._scene_handlers:
+            scene_name = "menu"
+        
+        # 既に表示中のシーンへの遷移では何もしない（効果音の停止なども不要）
+        if scene_name == self._current_scene_name:
+            return True
+        
+        # 新しいシーンではタイマーを再設定できるようにする
+        self._completion_timer_set = False
+        
         # 現在のシーンを終了
         if self.current_scene:
             self.current_scene.exit()
@@ -79,51 +137,47 @@ class GameFlowManager:
         # シーン切り替え時に効果音を停止
         self.audio_system.stop_all_sfx()
         
-        # 新しいシーンを作成または取得
-        if scene_name == "game":
-            # ゲーム開始時の処理
-            self.game_start_time = time.time()
-            self.game_result = {
-                'pets_rescued': 0,
-                'total_pets': 4,
-                'time_taken': 0,
-                'score': 0
-            }
-            self.scenes["game"] = GameScene(self.screen, self)
-            # ゲームBGM再生
-            self.audio_system.play_bgm("residential_bgm")
-            
-        elif scene_name == "result":
-            # ゲーム終了時の処理
-            if "game" in self.scenes:
-                game_scene = self.scenes["game"]
-                self.game_result = self._collect_game_result(game_scene)
-            self.scenes["result"] = ResultScene(self.screen, self.game_result)
-            
-            # 結果に応じてBGM再生
-            if self.game_result.get('pets_rescued', 0) >= self.game_result.get('total_pets', 4):
-                # 勝利BGM
-                self.audio_system.play_bgm("victory_bgm")
-            else:
-                # ゲームオーバーBGM
-                self.audio_system.play_bgm("gameover_bgm")
-            
-        elif scene_name == "menu":
-            # メニューBGM再生
-            self.audio_system.play_bgm("menu_bgm")
+        # 遷移先ごとの処理（戻り値は再生するBGM名）
+        bgm = self._scene_handlers[scene_name]()
         
-        # シーンが存在しない場合はメニューに戻る
-        if scene_name not in self.scenes:
-            scene_name = "menu"
-            self.audio_system.play_bgm("menu_bgm")
+        # 初めての遷移ならシーンを作成し、2回目以降は状態だけを初期化して再利用
+        # （背景画像・マップなどの読み込みを繰り返さない）
+        scene = self.scenes.get(scene_name)
+        if scene is None:
+            self.scenes[scene_name] = self._scene_factories[scene_name]()
+        else:
+            scene.reset(game_result=self.game_result.to_dict())
+        
+        self.audio_system.play_bgm(bgm)
         
         # 新しいシーンを設定
         self.current_scene = self.scenes[scene_name]
+        self._current_scene_name = scene_name
         self.current_scene.enter()
         
         return True
     
-    def _collect_game_result(self, game_scene) -> Dict[str, Any]:
+    def _enter_menu(self) -> str:
+        """メニューへの遷移処理"""
+        return "menu_bgm"
+    
+    def _enter_game(self) -> str:
+        """ゲーム開始時の処理"""
+        self.game_start_time_ms = pygame.time.get_ticks()
+        self.game_result = GameResult()
+        self._pending_rescues.clear()
+        return "residential_bgm"
+    
+    def _enter_result(self) -> str:
+        """ゲーム終了時の処理（結果に応じて勝利／ゲームオーバーBGM）"""
+        game_scene = self.scenes.get("game")
+        if game_scene is not None:
+            self.game_result = self._collect_game_result(game_scene)
+        if self.game_result.pets_rescued >= self.game_result.total_pets:
+            return "victory_bgm"
+        return "gameover_bgm"
+    
+    def _collect_game_result(self, game_scene: Scene) -> GameResult:
         """
         ゲームシーンから結果を収集
         
@@ -131,36 +185,9 @@ class GameFlowManager:
             game_scene: ゲームシーンインスタンス
             
         Returns:
-            Dict[str, Any]: ゲーム結果
+            GameResult: ゲーム結果
         """
-        # GameSceneの新しいget_game_result()メソッドを使用
-        if hasattr(game_scene, 'get_game_result'):
-            return game_scene.get_game_result()
-        
-        # フォールバック：従来の方法
-        game_time = time.time() - self.game_start_time
-        
-        pets_rescued = 0
-        total_pets = 4
-        
-        if hasattr(game_scene, 'pets_rescued'):
-            pets_rescued = len(game_scene.pets_rescued)
-        
-        if hasattr(game_scene, 'pets'):
-            total_pets = len(game_scene.pets)
-        
-        # スコア計算
-        base_score = pets_rescued * 1000
-        time_bonus = max(0, 300 - int(game_time)) * 10  # 5分以内でボーナス
-        completion_bonus = 2000 if pets_rescued == total_pets else 0
-        total_score = base_score + time_bonus + completion_bonus
-        
-        return {
-            'pets_rescued': pets_rescued,
-            'total_pets': total_pets,
-            'time_taken': game_time,
-            'score': total_score
-        }
+        return GameResult.from_dict(game_scene.get_game_result())
     
     def handle_event(self, event: pygame.event.Event):
         """イベント処理"""
@@ -186,10 +213,29 @@ class GameFlowManager:
         # 現在のシーンを更新
         next_scene = self.current_scene.update(time_delta)
         
+        # このフレームの救出通知を集計
+        self.finalize_frame()
+        
         # シーン変更が要求された場合
         if next_scene:
             self.change_scene(next_scene)
     
+    def finalize_frame(self):
+        """フレーム中の救出通知をまとめて反映し、全ペット救出を1回だけ判定"""
+        n = len(self._pending_rescues)
+        if not n:
+            return
+        self._pending_rescues.clear()
+        
+        result = self.game_result
+        result.pets_rescued += n
+        
+        # 全ペット救出チェック（タイマーは1回だけ設定）
+        if result.pets_rescued >= result.total_pets and not self._completion_timer_set:
+            # 少し遅延してから結果画面に移行
+            pygame.time.set_timer(pygame.USEREVENT + 1, 2000)  # 2秒後
+            self._completion_timer_set = True
+    
     def draw(self, surface: pygame.Surface):
         """描画処理"""
         if self.current_scene:
@@ -201,10 +247,7 @@ class GameFlowManager:
     
     def get_current_scene_name(self) -> str:
         """現在のシーン名を取得"""
-        for name, scene in self.scenes.items():
-            if scene == self.current_scene:
-                return name
-        return "unknown"
+        return self._current_scene_name
     
     def notify_game_complete(self, result_data: Dict[str, Any]):
         """
@@ -219,27 +262,22 @@ class GameFlowManager:
     
     def notify_pet_rescued(self, pet_id: str):
         """
-        ペット救出通知
+        ペット救出通知（集計はフレーム末尾のfinalize_frameで行う）
         
         Args:
             pet_id: 救出されたペットのID
         """
-        self.game_result['pets_rescued'] += 1
-        
-        # 全ペット救出チェック
-        if self.game_result['pets_rescued'] >= self.game_result['total_pets']:
-            # 少し遅延してから結果画面に移行
-            pygame.time.set_timer(pygame.USEREVENT + 1, 2000)  # 2秒後
+        self._pending_rescues.append(pet_id)
     
     def get_game_stats(self) -> Dict[str, Any]:
         """現在のゲーム統計を取得"""
-        current_time = time.time() - self.game_start_time if self.game_start_time > 0 else 0
+        current_time = (pygame.time.get_ticks() - self.game_start_time_ms) / 1000.0 if self.game_start_time_ms > 0 else 0
         
         return {
-            'pets_rescued': self.game_result['pets_rescued'],
-            'total_pets': self.game_result['total_pets'],
+            'pets_rescued': self.game_result.pets_rescued,
+            'total_pets': self.game_result.total_pets,
             'time_elapsed': current_time,
-            'score': self.game_result['score']
+            'score': self.game_result.score
         }
     
     def game_over(self, reason: str = "unknown"):
@@ -249,16 +287,16 @@ class GameFlowManager:
         Args:
             reason: 敗北理由 ("time_up", "no_lives", "other")
         """
-        print(f"💀 ゲームオーバー: {reason}")
+        logger.debug("ゲームオーバー: %s", reason)
         
         # 現在のゲームシーンから結果を収集
-        if hasattr(self.current_scene, 'get_game_result'):
-            result_data = self.current_scene.get_game_result()
+        result_data = self.current_scene.get_game_result() if self.current_scene else {}
+        if result_data:
             result_data['defeat_reason'] = reason
             
             # 結果画面に遷移（ただし、新しい実装では直接メニューに戻る）
-            print("🏠 ゲームオーバー後、メニューに戻ります")
+            logger.debug("ゲームオーバー後、メニューに戻ります")
             # 実際の処理はGameSceneで行われるため、ここでは何もしない
         else:
-            print("⚠️ ゲーム結果を取得できませんでした")
+            logger.warning("ゲーム結果を取得できませんでした")
             self.change_scene("menu")
@@ -5,13 +5,33 @@ GameFlowManagerを使用したゲーム実行（パフォーマンス最適化
 
 import pygame
 import sys
+import logging
+from typing import Optional
 from src.core.game_flow import GameFlowManager
 from src.utils.performance_optimizer import get_performance_optimizer
+from src.utils.frame_pacer import FramePacer
 from src.utils.language_manager import get_language_manager, get_text
 
+logger = logging.getLogger(__name__)
+
 class GameMain:
     """メインゲームクラス"""
     
+    # キューに積まないイベント種別（入力に使わない機器から大量に届く種別のみSDL側で破棄）
+    BLOCKED_EVENT_TYPES = [
+        pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+        pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+        pygame.CONTROLLERAXISMOTION, pygame.CONTROLLERBUTTONDOWN, pygame.CONTROLLERBUTTONUP,
+        pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION, pygame.MULTIGESTURE,
+        pygame.AUDIODEVICEADDED, pygame.AUDIODEVICEREMOVED,
+    ]
+    
+    # 1フレーム内で最後の1件だけ処理すればよいイベント種別
+    COALESCED_EVENT_TYPES = (pygame.MOUSEMOTION, pygame.VIDEORESIZE)
+    
+    # 静止画面でイベントを待つ最大時間（ミリ秒）
+    IDLE_WAIT_MS = 50
+    
     def __init__(self):
         print("🎮 GameMain 初期化開始")
         
@@ -27,7 +47,7 @@ class GameMain:
             if self.is_web:
                 print("🌐 Web環境用音声初期化")
                 try:
-                    pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=1024)
+                    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
                 except Exception as e:
                     print(f"⚠️ Web音声初期化失敗: {e}")
             else:
@@ -59,10 +79,24 @@ class GameMain:
                 print("🖥️ デスクトップ環境用画面設定")
                 self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
             
+            # シーン作成時の画面サイズ（背景画像がこのサイズで用意される）
+            self._scene_size = self.screen.get_size()
+            
+            # GameMain自身が処理するイベント（その他はゲームフローへ渡す）
+            self._event_handlers = {
+                pygame.QUIT: self._on_quit,
+                pygame.VIDEORESIZE: self._handle_resize,
+            }
+            
+            # 不要なイベント種別はキューに積まない
+            pygame.event.set_blocked(self.BLOCKED_EVENT_TYPES)
+            
+            # 最後に設定したウィンドウタイトル（同じタイトルの再設定を省く）
+            self._last_title: Optional[str] = None
+            
             # 言語管理システム
             print("🌐 言語管理システム初期化中...")
             try:
-                from src.utils.language_manager import get_language_manager
                 self.language_manager = get_language_manager()
                 self.update_window_title()
                 print("✅ 言語管理システム初期化完了")
@@ -73,7 +107,6 @@ class GameMain:
             # パフォーマンス最適化
             print("⚡ パフォーマンス最適化システム初期化中...")
             try:
-                from src.utils.performance_optimizer import get_performance_optimizer
                 self.optimizer = get_performance_optimizer()
                 print("✅ パフォーマンス最適化システム初期化完了")
             except Exception as e:
@@ -83,20 +116,18 @@ class GameMain:
             # ゲームフロー管理
             print("🎮 ゲームフロー管理初期化中...")
             try:
-                from src.core.game_flow import GameFlowManager
                 self.flow_manager = GameFlowManager(self.screen)
                 print("✅ ゲームフロー管理初期化完了")
             except Exception as e:
                 print(f"❌ ゲームフロー管理初期化エラー: {e}")
                 raise
             
-            # 初期ウィンドウタイトル設定
-            self.update_window_title()
-            
             # ゲーム設定
-            self.clock = pygame.time.Clock()
             self.target_fps = 60 if not self.is_web else 30  # Web版はFPSを下げる
             
+            # フレームタイミング
+            self.frame_pacer = FramePacer(self.target_fps)
+            
             print("✅ GameMain 初期化完了")
             
         except Exception as e:
@@ -113,28 +144,30 @@ class GameMain:
         except ImportError:
             import os
             return os.environ.get('WEB_VERSION') == '1'
-        
-        # ゲーム設定
-        self.clock = pygame.time.Clock()
-        self.target_fps = 60
+    
+    @property
+    def game_flow(self) -> Optional[GameFlowManager]:
+        """ゲームフロー管理（flow_managerの別名）"""
+        return getattr(self, 'flow_manager', None)
     
     def update_window_title(self):
         """ウィンドウタイトルを現在の言語に応じて更新"""
         title = get_text("game_title")
+        if title == self._last_title:
+            return
         pygame.display.set_caption(title)
-        print(f"🪟 ウィンドウタイトル更新: '{title}'")
+        self._last_title = title
+        logger.debug("ウィンドウタイトル更新: '%s'", title)
     
     def initialize(self) -> bool:
         """ゲーム初期化（Web版対応）"""
         try:
             print("🎮 ゲーム初期化中...")
             
-            # ゲームフロー初期化
-            if hasattr(self, 'flow_manager'):
-                self.game_flow = self.flow_manager
-            else:
-                from src.core.game_flow import GameFlowManager
-                self.game_flow = GameFlowManager(self.screen)
+            # ゲームフローは__init__で作成済み（ここで再作成はしない）
+            if self.game_flow is None:
+                print("❌ ゲームフロー管理が初期化されていません")
+                return False
             
             print("✅ ゲーム初期化完了")
             return True
@@ -157,23 +190,18 @@ class GameMain:
             # パフォーマンス最適化：フレーム開始
             self.optimizer.begin_frame()
             
-            # フレーム時間計算
-            time_delta = self.clock.tick(self.target_fps) / 1000.0
+            # 次フレームの予定時刻まで待機してフレーム時間計算
+            self.frame_pacer.wait()
+            time_delta = self.frame_pacer.delta()
             
-            # イベント処理
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    print("🔴 QUIT イベント受信")
-                    self.game_flow.running = False
+            # イベント処理（静止画面では入力までスレッドを休止）
+            current_scene = self.game_flow.current_scene
+            idle = current_scene is not None and not current_scene.dirty
+            event_handlers = self._event_handlers
+            for event in self._poll_events(idle):
+                event_handlers.get(event.type, self._dispatch_event)(event)
+                if not self.game_flow.is_running():
                     break
-                elif event.type == pygame.VIDEORESIZE:
-                    self._handle_resize(event)
-                else:
-                    result = self.game_flow.handle_event(event)
-                    if result == "quit":
-                        print("🔴 ゲーム終了シグナル受信")
-                        self.game_flow.running = False
-                        break
             
             # 終了処理が要求されている場合はループを抜ける
             if not self.game_flow.is_running():
@@ -196,7 +224,8 @@ class GameMain:
             
             # 描画処理（最適化付き）
             self.optimizer.begin_draw()
-            self.screen.fill((0, 0, 0))  # 背景クリア
+            if self._needs_clear():
+                self.screen.fill((0, 0, 0))  # 背景クリア
             self.game_flow.draw(self.screen)
             self.optimizer.end_draw()
             
@@ -209,6 +238,55 @@ class GameMain:
         print("🔴 ゲーム終了処理開始")
         self._cleanup()
     
+    def _needs_clear(self) -> bool:
+        """描画前に画面をクリアする必要があるか"""
+        # シーンの背景画像は初期画面サイズで作られるため、リサイズ後は常にクリア
+        scene = self.game_flow.current_scene
+        if scene is None or not scene.opaque:
+            return True
+        return self.screen.get_size() != self._scene_size
+    
+    def _poll_events(self, wait: bool = False) -> list:
+        """
+        1フレーム分のイベントをまとめて取得（マウス移動・リサイズは最後の1件に集約）
+        
+        Args:
+            wait: Trueの場合、キューが空ならイベントが届くまで（最大IDLE_WAIT_MS）待機
+        """
+        if wait:
+            first = pygame.event.wait(self.IDLE_WAIT_MS)
+            events = pygame.event.get(pump=False)
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+        else:
+            pygame.event.pump()
+            events = pygame.event.get(pump=False)
+        if len(events) < 2:
+            return events
+        
+        # 集約対象の種別ごとに最後のイベントだけを残す（順序は維持）
+        last = {}
+        for event in events:
+            if event.type in self.COALESCED_EVENT_TYPES:
+                last[event.type] = event
+        if not last:
+            return events
+        keep = set(map(id, last.values()))
+        return [event for event in events
+                if event.type not in self.COALESCED_EVENT_TYPES or id(event) in keep]
+    
+    def _on_quit(self, event):
+        """ウィンドウを閉じる要求"""
+        print("🔴 QUIT イベント受信")
+        self.game_flow.running = False
+    
+    def _dispatch_event(self, event):
+        """ゲームフローへイベントを渡す"""
+        result = self.game_flow.handle_event(event)
+        if result == "quit":
+            print("🔴 ゲーム終了シグナル受信")
+            self.game_flow.running = False
+    
     def _handle_resize(self, event):
         """画面リサイズ処理"""
         self.screen_width = event.w
@@ -224,28 +302,26 @@ class GameMain:
     
     def _cleanup(self):
         """クリーンアップ処理"""
-        print("🧹 クリーンアップ開始...")
+        logger.debug("クリーンアップ開始")
         
         try:
             # ゲームフローの音声システムを停止
-            if hasattr(self, 'flow_manager') and self.flow_manager:
-                if hasattr(self.flow_manager, 'audio_system'):
-                    print("🔇 音声システム停止中...")
-                    self.flow_manager.audio_system.stop_bgm()
-                    self.flow_manager.audio_system.stop_all_sfx()
+            if self.game_flow is not None:
+                logger.debug("音声システム停止中")
+                self.game_flow.stop_audio()
         except Exception as e:
-            print(f"⚠️ 音声停止エラー: {e}")
+            logger.warning("音声停止エラー: %s", e)
         
         try:
             # Pygameを終了
-            print("🎮 Pygame終了中...")
+            logger.debug("Pygame終了中")
             pygame.mixer.quit()
             pygame.quit()
-            print("✅ Pygame終了完了")
+            logger.debug("Pygame終了完了")
         except Exception as e:
-            print(f"⚠️ Pygame終了エラー: {e}")
+            logger.warning("Pygame終了エラー: %s", e)
         
-        print("🔴 アプリケーション終了")
+        logger.debug("アプリケーション終了")
         sys.exit(0)
 
 def main():
@@ -4,20 +4,46 @@
 """
 
 import pygame
-from typing import Dict, List, Optional, Callable, Any
-from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Callable, Any, Tuple
+from collections import deque
 from enum import Enum
 import json
+import threading
 from pathlib import Path
+from types import MappingProxyType
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.core.animation import ease, EASE_LINEAR, EASE_OUT_CUBIC
+from src.utils.performance_optimizer import batch_blit
 from src.utils.font_manager import get_font_manager
 from src.utils.asset_manager import get_asset_manager
 from src.systems.save_load_system import SaveLoadSystem
 
+def _json_loads(data: bytes) -> Any:
+    """JSONを読み込み（orjsonがあれば使用）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+def _json_dumps(obj: Any) -> bytes:
+    """JSONをUTF-8バイト列に変換（orjsonがあれば使用）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _no_log(*args, **kwargs):
+    """ログ出力を行わない（python -O で実行した場合に使用）"""
+
 class MenuState(Enum):
     """メニュー状態"""
     TITLE = "title"
+    SETTINGS = "settings"
     PAUSE = "pause"
+    PET_COLLECTION = "pet_collection"
     SAVE_LOAD = "save_load"
     GAME = "game"
     QUIT = "quit"
@@ -31,34 +57,107 @@ class TransitionType(Enum):
     SLIDE_UP = "slide_up"
     SLIDE_DOWN = "slide_down"
 
-@dataclass
 class MenuButton:
-    """メニューボタン"""
-    text: str
-    action: Callable
-    rect: pygame.Rect = None
-    enabled: bool = True
-    visible: bool = True
-    color: tuple = (70, 130, 180)
-    hover_color: tuple = (100, 149, 237)
-    text_color: tuple = (255, 255, 255)
-    font_size: int = 20
+    """メニューボタン
+    
+    text・enabled・visibleを変更するとon_changeが呼ばれる（描画キャッシュの破棄用）
+    """
+    __slots__ = ('_text', 'action', 'rect', '_enabled', '_visible', 'color',
+                 'hover_color', 'text_color', 'font_size', 'surface_cache',
+                 'dimmed_color', 'dimmed_hover_color', 'dimmed_text_color', 'on_change')
+    
+    def __init__(self, text: str, action: Callable, rect: pygame.Rect = None,
+                 enabled: bool = True, visible: bool = True,
+                 color: tuple = (70, 130, 180), hover_color: tuple = (100, 149, 237),
+                 text_color: tuple = (255, 255, 255), font_size: int = 20):
+        # 表示内容が変わったときの通知先（MenuSystemが設定）
+        self.on_change: Optional[Callable[[], None]] = None
+        self._text = text
+        self.action = action
+        self.rect = rect
+        self._enabled = enabled
+        self._visible = visible
+        self.color = color
+        self.hover_color = hover_color
+        self.text_color = text_color
+        self.font_size = font_size
+        # 無効時に使う暗くした色（描画のたびに計算しない）
+        self.dimmed_color = tuple(c // 2 for c in color)
+        self.dimmed_hover_color = tuple(c // 2 for c in hover_color)
+        self.dimmed_text_color = tuple(c // 2 for c in text_color)
+        # 描画済みボタン画像のキャッシュ（(テキスト, サイズ, 有効, 選択中) → Surface）
+        self.surface_cache: Dict[tuple, pygame.Surface] = {}
+    
+    def _changed(self) -> None:
+        """表示内容の変更を通知"""
+        if self.on_change is not None:
+            self.on_change()
+    
+    @property
+    def text(self) -> str:
+        return self._text
+    
+    @text.setter
+    def text(self, value: str) -> None:
+        if value != self._text:
+            self._text = value
+            self._changed()
+    
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+    
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        if value != self._enabled:
+            self._enabled = value
+            self._changed()
+    
+    @property
+    def visible(self) -> bool:
+        return self._visible
+    
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        if value != self._visible:
+            self._visible = value
+            self._changed()
 
-@dataclass
 class MenuTransition:
     """画面遷移データ"""
-    transition_type: TransitionType
-    duration: float
-    current_time: float = 0.0
-    from_state: MenuState = None
-    to_state: MenuState = None
-    progress: float = 0.0
+    __slots__ = ('transition_type', 'duration', 'current_time',
+                 'from_state', 'to_state', 'progress')
+    
+    def __init__(self, transition_type: TransitionType, duration: float,
+                 current_time: float = 0.0, from_state: MenuState = None,
+                 to_state: MenuState = None, progress: float = 0.0):
+        self.transition_type = transition_type
+        self.duration = duration
+        self.current_time = current_time
+        self.from_state = from_state
+        self.to_state = to_state
+        self.progress = progress
 
 class MenuSystem:
     """メニューシステム管理クラス"""
     
+    # 遷移タイプごとのイージング（フェードは線形、スライドは減速しながら止まる）
+    TRANSITION_EASING = {
+        TransitionType.NONE: EASE_LINEAR,
+        TransitionType.FADE: EASE_LINEAR,
+        TransitionType.SLIDE_LEFT: EASE_OUT_CUBIC,
+        TransitionType.SLIDE_RIGHT: EASE_OUT_CUBIC,
+        TransitionType.SLIDE_UP: EASE_OUT_CUBIC,
+        TransitionType.SLIDE_DOWN: EASE_OUT_CUBIC,
+    }
+    
+    # 設定保存を遅延させる時間（秒）。この間の変更は1回の書き込みにまとめる
+    SAVE_DELAY = 0.5
+    
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
+        # メニュー操作のログ出力（最適化実行時は何もしない関数に差し替え、書式化と出力のコストを省く）
+        self._log = print if __debug__ else _no_log
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
         
@@ -74,11 +173,16 @@ class MenuSystem:
         # 状態管理
         self.current_state = MenuState.TITLE
         self.previous_state = None
-        self.state_stack: List[MenuState] = []
+        
+        # 再描画管理（表示内容が変わったらdirtyを立て、描画済みの状態・選択ボタンと比較する）
+        self.dirty = True
+        self._drawn_state: Optional[MenuState] = None
+        self._drawn_selected = -1
+        self.state_stack: Deque[MenuState] = deque(maxlen=16)
         
         # 画面遷移
         self.transition: Optional[MenuTransition] = None
-        self.transition_surface = pygame.Surface((self.screen_width, self.screen_height))
+        self._build_transition_surfaces()
         
         # メニューデータ
         self.menus: Dict[MenuState, List[MenuButton]] = {}
@@ -86,15 +190,39 @@ class MenuSystem:
         
         # 設定データ
         self.settings = self._load_settings()
+        self._settings_view = MappingProxyType(self.settings)
+        self._refresh_keybinds()
+        
+        # 設定保存（連続変更をまとめてバックグラウンドで書き込む）
+        self._settings_lock = threading.Lock()
+        # ファイル書き込みの直列化用（設定の更新はこのロックを待たない）
+        self._write_lock = threading.Lock()
+        self._settings_dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._async_save = not self._is_web_environment()
         
         # 入力管理
         self.selected_button = 0
         self.mouse_pos = (0, 0)
         self.keys_pressed = set()
         
+        # イベント種別ごとの処理
+        self._event_handlers: Dict[int, Callable[[pygame.event.Event], Optional[MenuState]]] = {
+            pygame.MOUSEMOTION: self._on_mouse_motion,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_button_down,
+            pygame.KEYDOWN: self._on_key_down,
+            pygame.KEYUP: self._on_key_up,
+        }
+        
+        # 画面ごとの組み立て済み転送リスト（(状態, 選択中, タイトル有無) → blitsの引数）
+        self._blit_cache: Dict[Tuple[MenuState, int, bool], List[Tuple[pygame.Surface, pygame.Rect]]] = {}
+        
         # 初期化
         self._setup_menus()
+        self._load_background_assets()
         self._setup_backgrounds()
+        self._build_title_cache()
+        self._bake_backgrounds()
         
         print("✅ メニューシステム初期化完了")
     
@@ -118,8 +246,7 @@ class MenuSystem:
         
         try:
             if Path(settings_file).exists():
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
+                settings = _json_loads(Path(settings_file).read_bytes())
                 # デフォルト設定とマージ
                 for key, value in default_settings.items():
                     if key not in settings:
@@ -130,16 +257,52 @@ class MenuSystem:
         
         return default_settings
     
-    def _save_settings(self):
-        """設定を保存"""
-        settings_file = "config/game_settings.json"
+    def _is_web_environment(self) -> bool:
+        """Web環境かどうか（Web版はスレッドが使えないため同期保存）"""
         try:
-            Path(settings_file).parent.mkdir(parents=True, exist_ok=True)
-            with open(settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, ensure_ascii=False, indent=2)
-            print("💾 設定保存完了")
-        except Exception as e:
-            print(f"❌ 設定保存エラー: {e}")
+            from src.utils.web_utils import is_web_environment
+            return is_web_environment()
+        except ImportError:
+            import os
+            return os.environ.get('WEB_VERSION') == '1'
+    
+    def _save_settings(self):
+        """設定の保存を予約（SAVE_DELAY秒以内の変更はまとめて書き込む）"""
+        self._settings_dirty = True
+        if not self._async_save:
+            self._flush_settings()
+            return
+        with self._settings_lock:
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self._flush_settings)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def _flush_settings(self):
+        """未保存の設定をファイルへ書き込む"""
+        settings_file = Path("config/game_settings.json")
+        with self._write_lock:
+            # 設定のロック中は直列化のみ行い、ファイル書き込み中にupdate_settingを待たせない
+            with self._settings_lock:
+                self._save_timer = None
+                if not self._settings_dirty:
+                    return
+                self._settings_dirty = False
+                try:
+                    data = _json_dumps(self.settings)
+                except Exception as e:
+                    print(f"❌ 設定保存エラー: {e}")
+                    return
+            
+            try:
+                settings_file.parent.mkdir(parents=True, exist_ok=True)
+                # 一時ファイルに書いてから置き換え、書き込み途中で終了しても設定ファイルが壊れないようにする
+                temp_file = settings_file.with_name(settings_file.name + ".tmp")
+                temp_file.write_bytes(data)
+                temp_file.replace(settings_file)
+                print("💾 設定保存完了")
+            except Exception as e:
+                print(f"❌ 設定保存エラー: {e}")
     
     def _setup_menus(self):
         """メニューを設定"""
@@ -187,6 +350,11 @@ class MenuSystem:
     
     def _calculate_button_positions(self):
         """ボタン位置を計算"""
+        self._blit_cache.clear()
+        
+        # 当たり判定用の配置情報（x範囲, 先頭y, 間隔, 高さ, 個数）
+        self._hit_meta: Dict[MenuState, Tuple[int, int, int, int, int, int]] = {}
+        
         for state, buttons in self.menus.items():
             if not buttons:
                 continue
@@ -194,50 +362,105 @@ class MenuSystem:
             # メニューの中央配置
             total_height = len(buttons) * 60 + (len(buttons) - 1) * 20
             start_y = (self.screen_height - total_height) // 2
+            button_width = 300
+            button_height = 50
+            button_stride = 70
+            button_x = (self.screen_width - button_width) // 2
             
-            for i, button in enumerate(buttons):
-                button_width = 300
-                button_height = 50
-                button_x = (self.screen_width - button_width) // 2
-                button_y = start_y + i * 70
-                
+            # 縦位置は等差数列なのでrangeで一括生成する
+            button_ys = range(start_y, start_y + len(buttons) * button_stride, button_stride)
+            for button, button_y in zip(buttons, button_ys):
                 button.rect = pygame.Rect(button_x, button_y, button_width, button_height)
+                button.on_change = self._on_button_changed
+                # 通常・選択中の画像を配置時に作成（初回表示やホバー時にフォント描画が走らないように）
+                if button.visible:
+                    self._get_button_surface(button, False)
+                    self._get_button_surface(button, True)
+            
+            self._hit_meta[state] = (button_x, button_x + button_width, start_y,
+                                     button_stride, button_height, len(buttons))
+    
+    def _on_button_changed(self):
+        """ボタンの表示内容が変わったら転送リストを作り直して再描画"""
+        self._blit_cache.clear()
+        self.dirty = True
+    
+    def _button_index_at(self, pos: tuple) -> Optional[int]:
+        """指定座標にあるボタンの番号を取得（等間隔の縦並びなので計算で求める）"""
+        meta = self._hit_meta.get(self.current_state)
+        if meta is None:
+            # 配置情報がない場合は1つずつ判定
+            for i, button in enumerate(self.menus.get(self.current_state, [])):
+                if button.rect and button.rect.collidepoint(pos):
+                    return i
+            return None
+        
+        x0, x1, start_y, stride, height, count = meta
+        mx, my = pos
+        if not x0 <= mx < x1 or my < start_y:
+            return None
+        index, offset = divmod(my - start_y, stride)
+        if index < count and offset < height:
+            return index
+        return None
     
     def _setup_backgrounds(self):
-        """背景を設定"""
+        """背景を設定（単色背景は色だけを保持し、半透明背景は初回表示時に作成）"""
+        self.backgrounds = {}
+        
         # 各メニューの背景色
-        background_colors = {
+        self._bg_colors: Dict[MenuState, tuple] = {
             MenuState.SETTINGS: (47, 79, 79),    # ダークスレートグレー
             MenuState.PAUSE: (0, 0, 0, 180),     # 半透明黒
             MenuState.PET_COLLECTION: (34, 139, 34),  # フォレストグリーン
             MenuState.SAVE_LOAD: (72, 61, 139)   # ダークスレートブルー
         }
         
-        # タイトル画面の背景画像を読み込み
-        title_background = self.asset_manager.load_image(
-            "backgrounds/menu_background.png", 
-            (self.screen_width, self.screen_height)
-        )
+        # タイトル画面の背景画像（画面サイズに合わせたもの）
+        title_background = self._get_title_background((self.screen_width, self.screen_height))
         
         if title_background:
             self.backgrounds[MenuState.TITLE] = title_background
-            print("✅ タイトル背景画像読み込み完了: menu_background.png")
         else:
             # フォールバック: デフォルト色
             title_surface = pygame.Surface((self.screen_width, self.screen_height))
             title_surface.fill((25, 25, 112))  # ミッドナイトブルー
             self.backgrounds[MenuState.TITLE] = title_surface
-            print("⚠️ タイトル背景画像が見つかりません。デフォルト色を使用")
+    
+    def _load_background_assets(self):
+        """背景画像をディスクから読み込む（起動時に1回だけ。画面サイズ変更時は拡縮のみ行う）"""
+        self._title_bg_raw = self.asset_manager.load_image("backgrounds/menu_background.png")
+        # 画面サイズ → 拡縮済みのタイトル背景
+        self._title_bg_scaled: Dict[Tuple[int, int], pygame.Surface] = {}
         
-        # その他のメニュー背景
-        for state, color in background_colors.items():
-            surface = pygame.Surface((self.screen_width, self.screen_height))
-            if len(color) == 4:  # アルファ値がある場合
-                surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-                surface.fill(color)
+        if self._title_bg_raw:
+            print("✅ タイトル背景画像読み込み完了: menu_background.png")
+        else:
+            print("⚠️ タイトル背景画像が見つかりません。デフォルト色を使用")
+    
+    def _get_title_background(self, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """指定サイズのタイトル背景を取得（一度拡縮したサイズは再利用）"""
+        background = self._title_bg_scaled.get(size)
+        if background is None and self._title_bg_raw:
+            if self._title_bg_raw.get_size() == size:
+                background = self._title_bg_raw
             else:
-                surface.fill(color)
-            self.backgrounds[state] = surface
+                background = pygame.transform.scale(self._title_bg_raw, size)
+            self._title_bg_scaled[size] = background
+        return background
+    
+    def _get_background(self, state: MenuState) -> Optional[pygame.Surface]:
+        """背景サーフェスを取得（単色の不透明背景はNoneを返し、fillで描画する）"""
+        background = self.backgrounds.get(state)
+        if background is None:
+            color = self._bg_colors.get(state)
+            if color is None or len(color) != 4:
+                return None
+            # アルファ値がある場合のみサーフェスを作成
+            background = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+            background.fill(color)
+            self.backgrounds[state] = background
+        return background
     
     def update(self, time_delta: float, events: List[pygame.event.Event]) -> MenuState:
         """メニュー更新"""
@@ -248,72 +471,127 @@ class MenuSystem:
                 self._complete_transition()
         
         # イベント処理
+        # 連続するMOUSEMOTIONは最後の1件だけ処理する（クリック等との順序は保つ）
+        pending_motion = None
         for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                pending_motion = event
+                continue
+            if pending_motion is not None:
+                self._on_mouse_motion(pending_motion)
+                pending_motion = None
             result = self._handle_event(event)
             if result:
                 return result
+        if pending_motion is not None:
+            self._on_mouse_motion(pending_motion)
         
         return self.current_state
     
     def _handle_event(self, event: pygame.event.Event) -> Optional[MenuState]:
         """イベント処理"""
-        if event.type == pygame.MOUSEMOTION:
-            self.mouse_pos = event.pos
-            self._update_button_hover()
-        
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:  # 左クリック
-                return self._handle_button_click()
-        
-        elif event.type == pygame.KEYDOWN:
-            self.keys_pressed.add(event.key)
-            return self._handle_keyboard_input(event.key)
-        
-        elif event.type == pygame.KEYUP:
-            self.keys_pressed.discard(event.key)
-        
+        handler = self._event_handlers.get(event.type)
+        if handler:
+            return handler(event)
+        return None
+    
+    def _on_mouse_motion(self, event: pygame.event.Event) -> Optional[MenuState]:
+        """マウス移動"""
+        self.mouse_pos = event.pos
+        self._update_button_hover()
+        return None
+    
+    def _on_mouse_button_down(self, event: pygame.event.Event) -> Optional[MenuState]:
+        """マウスボタン押下"""
+        if event.button == 1:  # 左クリック
+            return self._handle_button_click()
         return None
     
+    def _on_key_down(self, event: pygame.event.Event) -> Optional[MenuState]:
+        """キー押下"""
+        self.keys_pressed.add(event.key)
+        return self._handle_keyboard_input(event.key)
+    
+    def _on_key_up(self, event: pygame.event.Event) -> Optional[MenuState]:
+        """キー解放"""
+        self.keys_pressed.discard(event.key)
+        return None
+    
+    def _refresh_keybinds(self):
+        """キー設定からキーコード→操作の対応表を作成"""
+        key_bindings = self.settings["key_bindings"]
+        self._k_up = key_bindings["up"]
+        self._k_down = key_bindings["down"]
+        self._k_action = key_bindings["action"]
+        self._k_cancel = key_bindings["cancel"]
+        
+        # 同じキーが複数の操作に割り当てられた場合は上・下・決定・キャンセルの順で優先
+        self._key_actions: Dict[int, Callable[[List[MenuButton]], Optional[MenuState]]] = {}
+        for keys, handler in (
+            ((pygame.K_ESCAPE, self._k_cancel), self._on_cancel_key),
+            ((pygame.K_RETURN, self._k_action), self._on_action_key),
+            ((pygame.K_DOWN, self._k_down), self._on_down_key),
+            ((pygame.K_UP, self._k_up), self._on_up_key),
+        ):
+            for key in keys:
+                self._key_actions[key] = handler
+    
     def _handle_keyboard_input(self, key: int) -> Optional[MenuState]:
-        """キーボード入力処理"""
-        current_buttons = self.menus.get(self.current_state, [])
-        if not current_buttons:
+        """キーボード入力処理（割り当てのないキーは1回の辞書参照で終わる）"""
+        handler = self._key_actions.get(key)
+        if handler is None:
             return None
         
-        if key == pygame.K_UP or key == self.settings["key_bindings"]["up"]:
-            self.selected_button = (self.selected_button - 1) % len(current_buttons)
-        
-        elif key == pygame.K_DOWN or key == self.settings["key_bindings"]["down"]:
-            self.selected_button = (self.selected_button + 1) % len(current_buttons)
-        
-        elif key == pygame.K_RETURN or key == self.settings["key_bindings"]["action"]:
-            if 0 <= self.selected_button < len(current_buttons):
-                button = current_buttons[self.selected_button]
-                if button.enabled:
-                    return button.action()
-        
-        elif key == pygame.K_ESCAPE or key == self.settings["key_bindings"]["cancel"]:
-            if self.current_state != MenuState.TITLE:
-                return self._go_back()
-        
+        current_buttons = self.menus.get(self.current_state)
+        if not current_buttons:
+            return None
+        return handler(current_buttons)
+    
+    def _on_up_key(self, buttons: List[MenuButton]) -> Optional[MenuState]:
+        """上キー: 前のボタンを選択"""
+        self.selected_button = (self.selected_button - 1) % len(buttons)
+        return None
+    
+    def _on_down_key(self, buttons: List[MenuButton]) -> Optional[MenuState]:
+        """下キー: 次のボタンを選択"""
+        self.selected_button = (self.selected_button + 1) % len(buttons)
+        return None
+    
+    def _on_action_key(self, buttons: List[MenuButton]) -> Optional[MenuState]:
+        """決定キー: 選択中のボタンを実行"""
+        if 0 <= self.selected_button < len(buttons):
+            button = buttons[self.selected_button]
+            if button.enabled:
+                return button.action()
+        return None
+    
+    def _on_cancel_key(self, buttons: List[MenuButton]) -> Optional[MenuState]:
+        """キャンセルキー: 前の画面に戻る"""
+        if self.current_state is not MenuState.TITLE:
+            return self._go_back()
         return None
     
     def _update_button_hover(self):
         """ボタンホバー状態を更新"""
-        current_buttons = self.menus.get(self.current_state, [])
-        for i, button in enumerate(current_buttons):
-            if button.rect and button.rect.collidepoint(self.mouse_pos):
-                self.selected_button = i
-                break
+        index = self._button_index_at(self.mouse_pos)
+        if index is not None:
+            self.selected_button = index
     
     def _handle_button_click(self) -> Optional[MenuState]:
         """ボタンクリック処理"""
-        current_buttons = self.menus.get(self.current_state, [])
-        for button in current_buttons:
-            if button.rect and button.rect.collidepoint(self.mouse_pos) and button.enabled:
-                return button.action()
+        index = self._button_index_at(self.mouse_pos)
+        if index is None:
+            return None
+        button = self.menus[self.current_state][index]
+        if button.enabled:
+            return button.action()
         return None
     
+    def _build_transition_surfaces(self):
+        """画面遷移用の黒いサーフェスを作成（毎フレームの確保・塗りつぶしを避ける）"""
+        self.transition_surface = pygame.Surface((self.screen_width, self.screen_height))
+        self.transition_surface.fill((0, 0, 0))
+    
     def _update_transition(self, time_delta: float):
         """画面遷移を更新"""
         if not self.transition:
@@ -327,6 +605,7 @@ class MenuSystem:
         if self.transition and self.transition.to_state:
             self.current_state = self.transition.to_state
         self.transition = None
+        self.dirty = True
     
     def start_transition(self, to_state: MenuState, transition_type: TransitionType = TransitionType.FADE, duration: float = 0.3):
         """画面遷移を開始"""
@@ -353,51 +632,51 @@ class MenuSystem:
     # メニューアクション
     def _start_game(self) -> MenuState:
         """ゲーム開始"""
-        print("🎮 ゲーム開始")
+        self._log("🎮 ゲーム開始")
         self.start_transition(MenuState.GAME, TransitionType.FADE)
         return MenuState.GAME
     
     def _open_settings(self) -> MenuState:
         """設定画面を開く"""
-        print("⚙️ 設定画面を開く")
+        self._log("⚙️ 設定画面を開く")
         self.push_state(MenuState.SETTINGS)
         self.start_transition(MenuState.SETTINGS, TransitionType.SLIDE_LEFT)
         return None
     
     def _open_pet_collection(self) -> MenuState:
         """ペット図鑑を開く"""
-        print("📖 ペット図鑑を開く")
+        self._log("📖 ペット図鑑を開く")
         self.push_state(MenuState.PET_COLLECTION)
         self.start_transition(MenuState.PET_COLLECTION, TransitionType.SLIDE_UP)
         return None
     
     def _open_save_load(self) -> MenuState:
         """セーブ/ロード画面を開く"""
-        print("💾 セーブ/ロード画面を開く")
+        self._log("💾 セーブ/ロード画面を開く")
         self.push_state(MenuState.SAVE_LOAD)
         self.start_transition(MenuState.SAVE_LOAD, TransitionType.SLIDE_DOWN)
         return None
     
     def _quit_game(self) -> MenuState:
         """ゲーム終了"""
-        print("👋 ゲーム終了")
+        self._log("👋 ゲーム終了")
         return MenuState.QUIT
     
     def _resume_game(self) -> MenuState:
         """ゲーム再開"""
-        print("▶️ ゲーム再開")
+        self._log("▶️ ゲーム再開")
         return MenuState.GAME
     
     def _return_to_title(self) -> MenuState:
         """タイトルに戻る"""
-        print("🏠 タイトルに戻る")
+        self._log("🏠 タイトルに戻る")
         self.state_stack.clear()
         self.start_transition(MenuState.TITLE, TransitionType.FADE)
         return None
     
     def _go_back(self) -> MenuState:
         """前の画面に戻る"""
-        print("⬅️ 前の画面に戻る")
+        self._log("⬅️ 前の画面に戻る")
         if self.state_stack:
             previous = self.state_stack[-1]
             self.pop_state()
@@ -406,95 +685,97 @@ class MenuSystem:
     
     def _quick_save(self) -> MenuState:
         """クイックセーブ"""
-        print("⚡ クイックセーブ実行中...")
+        self._log("⚡ クイックセーブ実行中...")
         
         # 現在のゲームデータを取得（デモ用）
         game_data = self._get_current_game_data()
         
         # クイックセーブ実行
         if self.save_load_system.quick_save(game_data):
-            print("✅ クイックセーブ完了")
+            self._log("✅ クイックセーブ完了")
         else:
-            print("❌ クイックセーブ失敗")
+            self._log("❌ クイックセーブ失敗")
             
         return None
     
     def _save_game(self) -> MenuState:
         """ゲームセーブ"""
-        print("💾 セーブ画面を表示")
+        self._log("💾 セーブ画面を表示")
         
         # セーブスロット情報を取得
         save_slots = self.save_load_system.get_save_slots()
         
-        print("📋 セーブスロット状況:")
-        for i, slot in enumerate(save_slots):
-            if slot:
-                print(f"  スロット{i}: {slot.save_name} ({slot.save_date})")
-            else:
-                print(f"  スロット{i}: 空き")
+        if __debug__:
+            self._log("📋 セーブスロット状況:")
+            for i, slot in enumerate(save_slots):
+                if slot:
+                    self._log(f"  スロット{i}: {slot.save_name} ({slot.save_date})")
+                else:
+                    self._log(f"  スロット{i}: 空き")
         
         # デモ: 最初の空きスロットにセーブ
         game_data = self._get_current_game_data()
         for i, slot in enumerate(save_slots):
             if slot is None:
                 if self.save_load_system.save_game(i, game_data, f"セーブデータ {i+1}"):
-                    print(f"✅ スロット{i}にセーブ完了")
+                    self._log(f"✅ スロット{i}にセーブ完了")
                     break
         else:
-            print("⚠️ 空きスロットがありません")
+            self._log("⚠️ 空きスロットがありません")
             
         return None
     
     def _load_game(self) -> MenuState:
         """ゲームロード"""
-        print("📂 ロード画面を表示")
+        self._log("📂 ロード画面を表示")
         
         # セーブスロット情報を取得
         save_slots = self.save_load_system.get_save_slots()
         
-        print("📋 ロード可能なセーブデータ:")
-        available_saves = []
-        for i, slot in enumerate(save_slots):
-            if slot:
-                print(f"  スロット{i}: {slot.save_name}")
-                print(f"    日時: {slot.save_date}")
-                print(f"    プレイ時間: {slot.play_time:.1f}秒")
-                available_saves.append(i)
-            else:
-                print(f"  スロット{i}: 空き")
+        if __debug__:
+            self._log("📋 ロード可能なセーブデータ:")
+            for i, slot in enumerate(save_slots):
+                if slot:
+                    self._log(f"  スロット{i}: {slot.save_name}")
+                    self._log(f"    日時: {slot.save_date}")
+                    self._log(f"    プレイ時間: {slot.play_time:.1f}秒")
+                else:
+                    self._log(f"  スロット{i}: 空き")
+        available_saves = [i for i, slot in enumerate(save_slots) if slot]
         
         # デモ: 最初のセーブデータをロード
         if available_saves:
             slot_id = available_saves[0]
             save_data = self.save_load_system.load_game(slot_id)
             if save_data:
-                print(f"✅ {save_data.save_name} をロード完了")
+                self._log(f"✅ {save_data.save_name} をロード完了")
                 # ここで実際のゲーム状態を復元（今後実装）
             else:
-                print("❌ ロードに失敗しました")
+                self._log("❌ ロードに失敗しました")
         else:
-            print("⚠️ ロード可能なセーブデータがありません")
+            self._log("⚠️ ロード可能なセーブデータがありません")
             
         return None
     
     def _view_collection(self) -> MenuState:
         """図鑑を見る"""
-        print("📖 図鑑を表示")
+        self._log("📖 図鑑を表示")
         # ペット図鑑の詳細表示
-        collection_data = self.settings.get('pet_collection', {})
-        total_pets = 4  # デモでは4匹（犬、猫、うさぎ、鳥）
-        found_pets = len([p for p in collection_data.values() if p.get('found', False)])
-        print(f"  発見済み: {found_pets}/{total_pets}")
-        
-        pet_types = ['犬', '猫', 'うさぎ', '鳥']
-        for pet_type in pet_types:
-            status = "発見済み" if collection_data.get(pet_type, {}).get('found', False) else "未発見"
-            print(f"  {pet_type}: {status}")
+        if __debug__:
+            collection_data = self.settings.get('pet_collection', {})
+            total_pets = 4  # デモでは4匹（犬、猫、うさぎ、鳥）
+            found_pets = len([p for p in collection_data.values() if p.get('found', False)])
+            self._log(f"  発見済み: {found_pets}/{total_pets}")
+            
+            pet_types = ['犬', '猫', 'うさぎ', '鳥']
+            for pet_type in pet_types:
+                status = "発見済み" if collection_data.get(pet_type, {}).get('found', False) else "未発見"
+                self._log(f"  {pet_type}: {status}")
         return None
     
     def _view_stats(self) -> MenuState:
         """統計を見る"""
-        print("📊 統計を表示")
+        self._log("📊 統計を表示")
         # ゲーム統計の詳細表示
         stats = self.settings.get('game_stats', {})
         play_time = stats.get('total_play_time', 0)
@@ -502,27 +783,27 @@ class MenuSystem:
         areas_explored = stats.get('areas_explored', 0)
         items_collected = stats.get('items_collected', 0)
         
-        print(f"  プレイ時間: {play_time//3600}時間{(play_time%3600)//60}分")
-        print(f"  救出したペット: {pets_rescued}匹")
-        print(f"  探索したエリア: {areas_explored}箇所")
-        print(f"  収集したアイテム: {items_collected}個")
+        self._log(f"  プレイ時間: {play_time//3600}時間{(play_time%3600)//60}分")
+        self._log(f"  救出したペット: {pets_rescued}匹")
+        self._log(f"  探索したエリア: {areas_explored}箇所")
+        self._log(f"  収集したアイテム: {items_collected}個")
         return None
     
     def _open_audio_settings(self) -> MenuState:
         """音量設定"""
-        print("🔊 音量設定")
+        self._log("🔊 音量設定")
         # 音量設定の詳細表示
         master_volume = self.settings.get('master_volume', 0.8)
         bgm_volume = self.settings.get('bgm_volume', 0.7)
         se_volume = self.settings.get('se_volume', 0.8)
-        print(f"  マスター音量: {master_volume:.1%}")
-        print(f"  BGM音量: {bgm_volume:.1%}")
-        print(f"  効果音音量: {se_volume:.1%}")
+        self._log(f"  マスター音量: {master_volume:.1%}")
+        self._log(f"  BGM音量: {bgm_volume:.1%}")
+        self._log(f"  効果音音量: {se_volume:.1%}")
         return None
     
     def _open_key_config(self) -> MenuState:
         """キー設定"""
-        print("⌨️ キー設定")
+        self._log("⌨️ キー設定")
         # キー設定の詳細表示
         key_bindings = self.settings.get('key_bindings', {
             'move_up': 'W',
@@ -532,29 +813,69 @@ class MenuSystem:
             'interact': 'SPACE',
             'menu': 'ESC'
         })
-        for action, key in key_bindings.items():
-            print(f"  {action}: {key}")
+        if __debug__:
+            for action, key in key_bindings.items():
+                self._log(f"  {action}: {key}")
         return None
     
     def _open_display_settings(self) -> MenuState:
         """画面設定"""
-        print("🖥️ 画面設定")
+        self._log("🖥️ 画面設定")
         # 画面設定の詳細表示
         resolution = self.settings.get('resolution', '1280x720')
         vsync = self.settings.get('vsync', True)
-        print(f"  解像度: {resolution}")
-        print(f"  垂直同期: {'ON' if vsync else 'OFF'}")
+        self._log(f"  解像度: {resolution}")
+        self._log(f"  垂直同期: {'ON' if vsync else 'OFF'}")
         return None
     
+    def needs_redraw(self) -> bool:
+        """前回の描画から表示内容が変わったか（遷移中は毎フレーム変化する）"""
+        return (self.dirty or self.transition is not None or self.current_state is not self._drawn_state or
+                self.selected_button != self._drawn_selected)
+    
+    def draw_selection(self) -> Optional[List[pygame.Rect]]:
+        """選択ボタンの変化だけを描き直す
+        
+        Returns:
+            描き直したボタンの領域のリスト（画面全体の再描画が必要な場合はNone）
+        """
+        if self.dirty or self.transition is not None or self.current_state is not self._drawn_state:
+            return None
+        
+        previous, selected = self._drawn_selected, self.selected_button
+        self._drawn_selected = selected
+        if previous == selected:
+            return []
+        
+        # ボタン画像は不透明で矩形全体を覆うため、前後の選択ボタンを上書きするだけでよい
+        buttons = self.menus.get(self.current_state, [])
+        blit_list = []
+        for i in (previous, selected):
+            if 0 <= i < len(buttons) and buttons[i].visible and buttons[i].rect:
+                blit_list.append((self._get_button_surface(buttons[i], i == selected), buttons[i].rect))
+        batch_blit(self.screen, blit_list)
+        return [rect.copy() for _, rect in blit_list]
+    
     def draw(self):
         """メニューを描画"""
+        self.dirty = False
+        self._drawn_state = self.current_state
+        self._drawn_selected = self.selected_button
+        
+        # タイトルを焼き込んだ背景がある画面は1回の転送で背景とタイトルを描画
+        baked = None if self.transition else self._baked_bg.get(self.current_state)
+        if baked is not None:
+            self.screen.blit(baked, (0, 0))
+            self._draw_current_menu(draw_title=False)
+            return
+        
         # 背景描画
-        if self.current_state in self.backgrounds:
-            if self.current_state == MenuState.PAUSE:
-                # ポーズメニューは半透明オーバーレイ
-                self.screen.blit(self.backgrounds[self.current_state], (0, 0))
-            else:
-                self.screen.blit(self.backgrounds[self.current_state], (0, 0))
+        # （ポーズメニューの背景は半透明なので、直前の画面に重ねて描画される）
+        background = self._get_background(self.current_state)
+        if background is not None:
+            self.screen.blit(background, (0, 0))
+        elif self.current_state in self._bg_colors:
+            self.screen.fill(self._bg_colors[self.current_state])
         
         # 画面遷移中の描画
         if self.transition:
@@ -562,21 +883,51 @@ class MenuSystem:
         else:
             self._draw_current_menu()
     
-    def _draw_current_menu(self):
-        """現在のメニューを描画"""
-        # タイトル描画
-        self._draw_menu_title()
+    def _bake_backgrounds(self):
+        """背景画像にタイトルを焼き込んだ画像を作成（背景・タイトルが変わったら再作成）"""
+        # 背景画像を持つ（不透明な）画面のみ対象。単色背景は画像を持たず、ポーズは半透明のため対象外
+        self._baked_bg: Dict[MenuState, pygame.Surface] = {}
+        for state, background in self.backgrounds.items():
+            title = self._title_cache.get(state)
+            if title is None:
+                continue
+            baked = pygame.Surface((self.screen_width, self.screen_height))
+            baked.blit(background, (0, 0))
+            baked.blit(*title)
+            if pygame.display.get_surface() is not None:
+                baked = baked.convert()
+            self._baked_bg[state] = baked
+    
+    def _draw_current_menu(self, draw_title: bool = True):
+        """現在のメニューを描画（タイトルとボタンを1回の転送でまとめて描画）"""
+        key = (self.current_state, self.selected_button, draw_title)
+        blit_list = self._blit_cache.get(key)
+        if blit_list is None:
+            blit_list = self._build_blit_list(draw_title)
+            self._blit_cache[key] = blit_list
+        batch_blit(self.screen, blit_list)
+    
+    def _build_blit_list(self, draw_title: bool) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """現在のメニューの転送リストを組み立てる（配置・タイトルが変わるまで再利用）"""
+        blit_list = []
         
-        # ボタン描画
+        # タイトル
+        title = self._title_cache.get(self.current_state) if draw_title else None
+        if title:
+            blit_list.append(title)
+        
+        # ボタン
         current_buttons = self.menus.get(self.current_state, [])
         for i, button in enumerate(current_buttons):
-            if not button.visible:
+            if not button.visible or not button.rect:
                 continue
             
-            self._draw_button(button, i == self.selected_button)
+            blit_list.append((self._get_button_surface(button, i == self.selected_button), button.rect))
+        
+        return blit_list
     
-    def _draw_menu_title(self):
-        """メニュータイトルを描画"""
+    def _build_title_cache(self):
+        """各メニューのタイトル画像と配置を作成（画面サイズ変更時も再作成）"""
         titles = {
             MenuState.TITLE: "ミステリー・ペット・レスキュー",
             MenuState.SETTINGS: "設定",
@@ -585,55 +936,64 @@ class MenuSystem:
             MenuState.SAVE_LOAD: "セーブ/ロード"
         }
         
-        title = titles.get(self.current_state, "")
-        if title:
-            font_size = 48 if self.current_state == MenuState.TITLE else 36
-            title_surface = self.font_manager.render_text(title, font_size, (255, 255, 255))
+        self._title_cache: Dict[MenuState, Tuple[pygame.Surface, pygame.Rect]] = {}
+        self._blit_cache.clear()
+        for state, title in titles.items():
+            font_size = 48 if state is MenuState.TITLE else 36
+            title_surface = self.font_manager.render_text(title, "default", font_size, (255, 255, 255))
             title_rect = title_surface.get_rect(center=(self.screen_width // 2, 100))
-            self.screen.blit(title_surface, title_rect)
+            self._title_cache[state] = (title_surface, title_rect)
     
-    def _draw_button(self, button: MenuButton, is_selected: bool):
-        """ボタンを描画"""
-        if not button.rect:
-            return
+    def _get_button_surface(self, button: MenuButton, is_selected: bool) -> pygame.Surface:
+        """ボタン画像を取得（描画済み画像を再利用）"""
+        key = (button.text, button.rect.size, button.enabled, is_selected)
+        surface = button.surface_cache.get(key)
+        if surface is None:
+            surface = self._render_button(button, is_selected)
+            button.surface_cache[key] = surface
+        return surface
+    
+    def _render_button(self, button: MenuButton, is_selected: bool) -> pygame.Surface:
+        """ボタン画像（背景・枠線・テキスト）を作成"""
+        surface = pygame.Surface(button.rect.size)
+        local_rect = surface.get_rect()
         
         # ボタン背景
-        color = button.hover_color if is_selected else button.color
-        if not button.enabled:
-            color = tuple(c // 2 for c in color)  # 無効時は暗くする
+        if button.enabled:
+            color = button.hover_color if is_selected else button.color
+        else:
+            color = button.dimmed_hover_color if is_selected else button.dimmed_color  # 無効時は暗くする
         
-        pygame.draw.rect(self.screen, color, button.rect)
-        pygame.draw.rect(self.screen, (255, 255, 255), button.rect, 2)
+        pygame.draw.rect(surface, color, local_rect)
+        pygame.draw.rect(surface, (255, 255, 255), local_rect, 2)
         
         # ボタンテキスト
-        text_color = button.text_color
-        if not button.enabled:
-            text_color = tuple(c // 2 for c in text_color)
+        text_color = button.text_color if button.enabled else button.dimmed_text_color
+        text_surface = self.font_manager.render_text(button.text, "default", button.font_size, text_color)
+        text_rect = text_surface.get_rect(center=local_rect.center)
+        surface.blit(text_surface, text_rect)
         
-        text_surface = self.font_manager.render_text(button.text, button.font_size, text_color)
-        text_rect = text_surface.get_rect(center=button.rect.center)
-        self.screen.blit(text_surface, text_rect)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
     
     def _draw_transition(self):
         """画面遷移を描画"""
         if not self.transition:
             return
         
-        progress = self.transition.progress
+        progress = ease(self.TRANSITION_EASING[self.transition.transition_type], self.transition.progress)
         
-        if self.transition.transition_type == TransitionType.FADE:
+        if self.transition.transition_type is TransitionType.FADE:
             # フェード遷移
-            alpha = int(255 * (1 - progress))
-            fade_surface = pygame.Surface((self.screen_width, self.screen_height))
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(alpha)
+            # 描画済みの画面に明るさを乗算して暗くする（黒の半透明サーフェスを重ねるのと同等）
             self._draw_current_menu()
-            self.screen.blit(fade_surface, (0, 0))
+            brightness = 255 - int(255 * (1 - progress))
+            self.screen.fill((brightness, brightness, brightness), special_flags=pygame.BLEND_RGB_MULT)
         
-        elif self.transition.transition_type == TransitionType.SLIDE_LEFT:
+        elif self.transition.transition_type is TransitionType.SLIDE_LEFT:
             # 左スライド遷移
             offset_x = int(self.screen_width * progress)
-            self.transition_surface.fill((0, 0, 0))
             # 現在の画面を右にスライド
             self.screen.blit(self.transition_surface, (-offset_x, 0))
             self._draw_current_menu()
@@ -641,12 +1001,20 @@ class MenuSystem:
         # 他の遷移タイプも同様に実装可能
     
     def get_settings(self) -> Dict[str, Any]:
-        """設定を取得"""
+        """設定を取得（変更可能なコピー）"""
         return self.settings.copy()
     
+    def settings_view(self) -> MappingProxyType:
+        """設定の読み取り専用ビューを取得（コピーしない）"""
+        return self._settings_view
+    
     def update_setting(self, key: str, value: Any):
         """設定を更新"""
-        self.settings[key] = value
+        with self._settings_lock:
+            self.settings[key] = value
+        if key == "key_bindings":
+            self._refresh_keybinds()
+        self.dirty = True
         self._save_settings()
     
     def _get_current_game_data(self) -> Dict[str, Any]:
@@ -679,7 +1047,11 @@ class MenuSystem:
     
     def cleanup(self):
         """クリーンアップ"""
-        self._save_settings()
+        with self._settings_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+        self._settings_dirty = True
+        self._flush_settings()
         print("🧹 メニューシステムクリーンアップ完了")
     
     def resize(self, new_width: int, new_height: int):
@@ -693,4 +1065,12 @@ class MenuSystem:
         # ボタン位置を再計算
         self._calculate_button_positions()
         
+        # タイトルの配置を再計算
+        self._build_title_cache()
+        self._bake_backgrounds()
+        
+        # 画面遷移用サーフェスを新しいサイズで作り直す
+        self._build_transition_surfaces()
+        self.dirty = True
+        
         print(f"🖥️ メニューシステム解像度変更: {new_width}x{new_height}")
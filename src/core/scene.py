@@ -5,14 +5,29 @@
 
 import pygame
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Dict, Any
 
 class Scene(ABC):
     """シーン基底クラス"""
     
+    # 入力がなくても毎フレーム更新・描画が必要か（Falseならイベント待ちで休止できる）
+    dirty: bool = True
+    
+    # 作成時の画面サイズで描画全体を不透明に塗りつぶすか（Trueなら事前の画面クリアが不要）
+    opaque: bool = False
+    
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
     
+    def reset(self, **kwargs) -> None:
+        """
+        シーンを再利用する前に状態を初期化
+        
+        Args:
+            **kwargs: シーン固有の初期化パラメータ（game_resultなど）
+        """
+        pass
+    
     @abstractmethod
     def enter(self) -> None:
         """シーンに入る時の処理"""
@@ -55,3 +70,12 @@ class Scene(ABC):
             surface: 描画対象のサーフェス
         """
         pass
+    
+    def get_game_result(self) -> Dict[str, Any]:
+        """
+        ゲーム結果を取得
+        
+        Returns:
+            Dict[str, Any]: ゲーム結果（結果を持たないシーンは空の辞書）
+        """
+        return {}
@@ -41,6 +41,9 @@ class PetData:
 class Pet:
     """ペットクラス"""
     
+    # プレイヤーと相互作用できる距離
+    INTERACT_DISTANCE = 60.0
+    
     def __init__(self, pet_data: PetData, x: float, y: float):
         # 基本情報
         self.data = pet_data
@@ -316,7 +319,7 @@ class Pet:
         """プレイヤーとの相互作用（簡素化版）"""
         distance = self._calculate_distance(player_pos)
         
-        if distance < 60.0:  # 相互作用可能距離
+        if distance < self.INTERACT_DISTANCE:  # 相互作用可能距離
             if self.state == PetState.SCARED:
                 # 恐怖状態では相互作用失敗
                 print(f"😰 {self.get_display_name()}は怖がっています")
@@ -345,15 +348,15 @@ class Pet:
         print(f"🎉 {self.get_display_name()}を救出しました！")
         return True
     
-    def draw(self, screen: pygame.Surface, camera_offset: Tuple[int, int] = (0, 0)):
-        """ペットを描画"""
+    def draw(self, screen: pygame.Surface, camera_offset: Tuple[int, int] = (0, 0)) -> pygame.Rect:
+        """ペットを描画し、描画した画面上の領域を返す"""
         draw_x = self.rect.x - camera_offset[0]
         draw_y = self.rect.y - camera_offset[1]
         
         # スプライト描画
-        if self.direction in self.sprites:
-            sprite = self.sprites[self.direction]
-            screen.blit(sprite, (draw_x, draw_y))
+        blit_args = self.get_blit_args(camera_offset)
+        if blit_args:
+            dirty_rect = screen.blit(*blit_args)
         else:
             # フォールバック: 色付き矩形
             color_map = {
@@ -363,18 +366,37 @@ class Pet:
                 PetType.BIRD: (0, 191, 255)    # 青
             }
             color = color_map.get(self.data.pet_type, (128, 128, 128))
-            pygame.draw.rect(screen, color, (draw_x, draw_y, self.rect.width, self.rect.height))
+            dirty_rect = pygame.draw.rect(screen, color, (draw_x, draw_y, self.rect.width, self.rect.height))
             
             # ペット名表示
             font = pygame.font.Font(None, 16)
             name_surface = font.render(self.get_display_name(), True, (255, 255, 255))
-            screen.blit(name_surface, (draw_x, draw_y - 20))
+            dirty_rect = dirty_rect.union(screen.blit(name_surface, (draw_x, draw_y - 20)))
+        
+        overlay_rect = self.draw_overlay(screen, camera_offset)
+        if overlay_rect:
+            dirty_rect = dirty_rect.union(overlay_rect)
         
+        return dirty_rect
+    
+    def get_blit_args(self, camera_offset: Tuple[int, int] = (0, 0)) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """スプライトの描画引数（サーフェス, 画面上の位置）を取得（スプライトがない場合はNone）
+        
+        Surface.blitsでまとめて描画するために使用。付加表示はdraw_overlayで描画する
+        """
+        sprite = self.sprites.get(self.direction)
+        if sprite is None:
+            return None
+        return (sprite, (self.rect.x - camera_offset[0], self.rect.y - camera_offset[1]))
+    
+    def draw_overlay(self, screen: pygame.Surface, camera_offset: Tuple[int, int] = (0, 0)) -> Optional[pygame.Rect]:
+        """スプライト以外の付加表示を描画し、描画した領域を返す"""
         # エモーション表示
         if self.current_emotion:
-            self._draw_emotion(screen, draw_x, draw_y)
+            return self._draw_emotion(screen, self.rect.x - camera_offset[0], self.rect.y - camera_offset[1])
+        return None
     
-    def _draw_emotion(self, screen: pygame.Surface, x: int, y: int):
+    def _draw_emotion(self, screen: pygame.Surface, x: int, y: int) -> pygame.Rect:
         """エモーションを描画"""
         emotion_symbols = {
             "happy": "♥",
@@ -389,7 +411,7 @@ class Pet:
         # ペットの上に表示
         emotion_x = x + self.rect.width // 2 - emotion_surface.get_width() // 2
         emotion_y = y - 30
-        screen.blit(emotion_surface, (emotion_x, emotion_y))
+        return screen.blit(emotion_surface, (emotion_x, emotion_y))
     
     def get_position(self) -> Tuple[float, float]:
         """位置を取得"""
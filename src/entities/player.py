@@ -219,19 +219,19 @@ class Player:
         # 将来的にアイテム使用やスキル発動などを追加可能
         pass
     
-    def draw(self, screen: pygame.Surface, camera_offset: Tuple[int, int] = (0, 0)):
-        """プレイヤーを描画"""
+    def draw(self, screen: pygame.Surface, camera_offset: Tuple[int, int] = (0, 0)) -> pygame.Rect:
+        """プレイヤーを描画し、描画した画面上の領域を返す"""
         draw_x = self.rect.x - camera_offset[0]
         draw_y = self.rect.y - camera_offset[1]
         
         # スプライト描画（透明度を保持）
-        if self.direction in self.sprites:
-            sprite = self.sprites[self.direction]
+        blit_args = self.get_blit_args(camera_offset)
+        if blit_args:
             # 画像をそのまま描画（透明度保持）
-            screen.blit(sprite, (draw_x, draw_y))
+            dirty_rect = screen.blit(*blit_args)
         else:
             # フォールバック: 矩形描画
-            pygame.draw.rect(screen, self.color, (draw_x, draw_y, self.rect.width, self.rect.height))
+            dirty_rect = pygame.draw.rect(screen, self.color, (draw_x, draw_y, self.rect.width, self.rect.height))
             
             # 方向インジケーター
             center_x = draw_x + self.rect.width // 2
@@ -252,24 +252,44 @@ class Player:
                                   [(draw_x + self.rect.width, center_y), (draw_x + self.rect.width - 10, center_y - 5), 
                                    (draw_x + self.rect.width - 10, center_y + 5)])
         
+        overlay_rect = self.draw_overlay(screen, camera_offset)
+        if overlay_rect:
+            dirty_rect = dirty_rect.union(overlay_rect)
+        
+        return dirty_rect
+    
+    def get_blit_args(self, camera_offset: Tuple[int, int] = (0, 0)) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """スプライトの描画引数（サーフェス, 画面上の位置）を取得（スプライトがない場合はNone）
+        
+        Surface.blitsでまとめて描画するために使用。付加表示はdraw_overlayで描画する
+        """
+        sprite = self.sprites.get(self.direction)
+        if sprite is None:
+            return None
+        return (sprite, (self.rect.x - camera_offset[0], self.rect.y - camera_offset[1]))
+    
+    def draw_overlay(self, screen: pygame.Surface, camera_offset: Tuple[int, int] = (0, 0)) -> Optional[pygame.Rect]:
+        """スプライト以外の付加表示を描画し、描画した領域を返す"""
         # スタミナバー（走行中のみ表示）
         if self.is_running or self.stats.stamina < self.stats.max_stamina:
-            self._draw_stamina_bar(screen, draw_x, draw_y)
+            return self._draw_stamina_bar(screen, self.rect.x - camera_offset[0], self.rect.y - camera_offset[1])
+        return None
     
-    def _draw_stamina_bar(self, screen: pygame.Surface, x: int, y: int):
+    def _draw_stamina_bar(self, screen: pygame.Surface, x: int, y: int) -> pygame.Rect:
         """スタミナバーを描画"""
         bar_width = self.rect.width
         bar_height = 4
         bar_y = y - 8
         
         # 背景
-        pygame.draw.rect(screen, (100, 100, 100), (x, bar_y, bar_width, bar_height))
+        bar_rect = pygame.draw.rect(screen, (100, 100, 100), (x, bar_y, bar_width, bar_height))
         
         # スタミナ
         stamina_ratio = self.stats.stamina / self.stats.max_stamina
         stamina_width = int(bar_width * stamina_ratio)
         stamina_color = (255, 255, 0) if stamina_ratio > 0.3 else (255, 100, 100)
         pygame.draw.rect(screen, stamina_color, (x, bar_y, stamina_width, bar_height))
+        return bar_rect
     
     def get_position(self) -> Tuple[float, float]:
         """位置を取得"""
@@ -7,6 +7,7 @@ import pygame
 import time
 from typing import Optional, List, Dict, Any, Tuple
 from src.core.scene import Scene
+from src.core.animation import AnimationManager, create_success_animation
 from src.entities.player import Player
 from src.entities.pet import Pet, PetData, PetType
 from src.systems.map_system import MapSystem
@@ -22,6 +23,9 @@ from src.utils.language_manager import get_language_manager, get_text
 class GameScene(Scene):
     """ゲームシーン"""
     
+    # 描画の最初に背景色で画面全体を塗りつぶす
+    opaque = True
+    
     def __init__(self, screen: pygame.Surface, flow_manager=None):
         super().__init__(screen)
         self.flow_manager = flow_manager
@@ -43,6 +47,29 @@ class GameScene(Scene):
         self._initialize_game_elements()
         
         # ゲーム状態
+        self._reset_game_state()
+    
+    def reset(self, **kwargs) -> None:
+        """新しいプレイに向けて状態を初期化（マップ・背景画像・UI画像は再利用）"""
+        self.e_key_pressed = False
+        
+        # プレイヤーとペットを作り直す（ペットは再度ランダム配置）
+        self.player = Player(x=100, y=100)
+        self.pets = self._create_pets()
+        self.current_puzzle = None
+        
+        # UI・タイマー・カメラ
+        self.game_ui.notifications.clear()
+        self.game_ui.clear_objective()
+        self.timer_system.reset()
+        self.camera_x = 0
+        self.camera_y = 0
+        self.effects.clear()
+        
+        self._reset_game_state()
+    
+    def _reset_game_state(self):
+        """ゲーム進行状態を初期化"""
         self.paused = False
         self.game_over = False
         self.victory = False
@@ -62,8 +89,11 @@ class GameScene(Scene):
         self.player_lives = 3  # プレイヤーのライフ
         
         # 統計情報
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.total_pets = len(self.pets)
+        
+        # 時間警告を表示済みか
+        self._warning_shown = False
     
     def _initialize_game_elements(self):
         """ゲーム要素を初期化"""
@@ -129,6 +159,9 @@ class GameScene(Scene):
         # カメラオフセット
         self.camera_x = 0
         self.camera_y = 0
+        
+        # 救出時などの演出アニメーション
+        self.effects = AnimationManager()
     
     def _load_background(self):
         """背景画像を読み込み"""
@@ -559,7 +592,7 @@ class GameScene(Scene):
     
     def enter(self) -> None:
         """シーンに入る時の処理"""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.pets_rescued = []
         self.game_over = False
         self.victory = False
@@ -698,6 +731,9 @@ class GameScene(Scene):
         if self.paused:
             return None
         
+        # 演出アニメーション更新（勝利・敗北表示中も最後の演出を進める）
+        self.effects.update_all(time_delta)
+        
         # 敗北表示時間更新（game_over状態でも実行）
         if self.game_over:
             self.defeat_display_time += time_delta
@@ -821,6 +857,9 @@ class GameScene(Scene):
         camera_offset = (self.camera_x, self.camera_y)
         self.player.draw(surface, camera_offset)
         
+        # 演出アニメーション描画
+        self.effects.draw_all(surface, camera_offset)
+        
         # パズルUI描画（削除済み）
         # if self.current_puzzle:
         #     self.puzzle_ui.draw()
@@ -916,6 +955,9 @@ class GameScene(Scene):
             # 短い効果音を1回のみ再生
             self.audio_system.play_sfx("pet_rescued")
             
+            # 救出位置に成功演出（ワールド座標で生成し、描画時にカメラ位置を差し引く）
+            self.effects.extend(create_success_animation(pet.rect.center))
+            
             # ペットを非表示にする
             pet.rescued = True
     
@@ -942,7 +984,7 @@ class GameScene(Scene):
             base_score += life_bonus
         
         # 効率ボーナス（短時間でクリア）
-        elapsed_time = time.time() - self.start_time
+        elapsed_time = time.monotonic() - self.start_time
         if self.victory and elapsed_time < 180:  # 3分以内
             base_score += 200
         
@@ -950,7 +992,7 @@ class GameScene(Scene):
     
     def get_game_result(self) -> Dict[str, Any]:
         """ゲーム結果を取得"""
-        elapsed_time = time.time() - self.start_time
+        elapsed_time = time.monotonic() - self.start_time
         final_score = self._calculate_final_score()
         
         # 敗北理由を判定
@@ -978,7 +1020,7 @@ class GameScene(Scene):
     
     def _update_ui_stats(self):
         """UI統計情報を更新"""
-        elapsed_time = time.time() - self.start_time
+        elapsed_time = time.monotonic() - self.start_time
         minutes = int(elapsed_time // 60)
         seconds = int(elapsed_time % 60)
         
@@ -1020,7 +1062,7 @@ class GameScene(Scene):
     def _on_time_warning(self):
         """時間警告コールバック"""
         # 警告は一度だけ表示
-        if not hasattr(self, '_warning_shown'):
+        if not self._warning_shown:
             self.game_ui.add_notification(get_text("time_warning"), NotificationType.WARNING)
             self._warning_shown = True
             
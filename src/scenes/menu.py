@@ -146,6 +146,12 @@ class LanguageSelector:
 class MenuScene(Scene):
     """メニューシーン"""
     
+    # 入力があるまで画面が変化しない
+    dirty = False
+    
+    # 背景画像（またはグラデーション）が画面全体を覆う
+    opaque = True
+    
     def __init__(self, screen: pygame.Surface):
         super().__init__(screen)
         
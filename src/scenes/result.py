@@ -22,12 +22,34 @@ class ResultButton:
 class ResultScene(Scene):
     """結果画面シーン"""
     
+    # 入力があるまで画面が変化しない
+    dirty = False
+    
+    # 背景画像（または背景色）が画面全体を覆う
+    opaque = True
+    
     def __init__(self, screen: pygame.Surface, game_result: Dict[str, Any]):
         super().__init__(screen)
-        self.game_result = game_result
         self.font_manager = get_font_manager()
         self.asset_manager = get_asset_manager()
         
+        # 背景画像の読み込み
+        self.background_image = None
+        self.background_color = (30, 50, 80)  # フォールバック色
+        self._load_background()
+        
+        # 色設定
+        self.normal_color = (255, 255, 255)
+        self.hover_color = (255, 255, 0)
+        self.selected_color = (0, 255, 0)
+        
+        # 結果データとボタン
+        self.reset(game_result)
+    
+    def reset(self, game_result: Dict[str, Any], **kwargs) -> None:
+        """新しいゲーム結果で表示内容を設定（背景画像などは再利用）"""
+        self.game_result = game_result
+        
         # 結果データ
         self.victory = game_result.get('victory', False)
         self.game_over = game_result.get('game_over', False)
@@ -39,20 +61,9 @@ class ResultScene(Scene):
         self.score = game_result.get('score', 0)
         self.completion_rate = (self.pets_rescued / self.total_pets) * 100 if self.total_pets > 0 else 0
         
-        # ボタン
+        # ボタン（言語設定が変わっている場合に備えて作り直す）
         self.buttons: List[ResultButton] = []
         self.selected_index = 0
-        
-        # 背景画像の読み込み
-        self.background_image = None
-        self.background_color = (30, 50, 80)  # フォールバック色
-        self._load_background()
-        
-        # 色設定
-        self.normal_color = (255, 255, 255)
-        self.hover_color = (255, 255, 0)
-        self.selected_color = (0, 255, 0)
-        
         self._create_buttons()
     
     def _create_buttons(self):
@@ -22,7 +22,7 @@ class AudioSystem:
         if not pygame.mixer.get_init():
             if self.is_web:
                 # Web環境では軽量設定
-                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=1024)
+                pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
                 print("🌐 Web環境用音声初期化")
             else:
                 pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
@@ -30,7 +30,7 @@ class TimerSystem:
     def start(self):
         """タイマー開始"""
         if self.state == TimerState.PAUSED:
-            current_time = time.time()
+            current_time = time.monotonic()
             if self.start_time is None:
                 self.start_time = current_time
             elif self.pause_time is not None:
@@ -44,7 +44,7 @@ class TimerSystem:
     def pause(self):
         """タイマー一時停止"""
         if self.state == TimerState.RUNNING:
-            self.pause_time = time.time()
+            self.pause_time = time.monotonic()
             self.state = TimerState.PAUSED
     
     def reset(self):
@@ -59,7 +59,7 @@ class TimerSystem:
         if self.state != TimerState.RUNNING or self.start_time is None:
             return
         
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed_time = current_time - self.start_time
         self.remaining_time = max(0, self.time_limit - elapsed_time)
         
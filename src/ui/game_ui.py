@@ -184,21 +184,27 @@ class GameUI:
                 slot.cooldown = max(0, slot.cooldown)
     
     def draw(self, player_stats: Dict[str, Any], world_objects: List[Any] = None, 
-             player_pos: Tuple[float, float] = (0, 0)):
-        """UIを描画"""
+             player_pos: Tuple[float, float] = (0, 0)) -> List[pygame.Rect]:
+        """UIを描画し、描画した画面上の領域のリストを返す"""
+        dirty_rects = []
+        
         # クイックスロット
-        self._draw_quick_slots()
+        dirty_rects.extend(self._draw_quick_slots())
         
         # 現在の目標
-        self._draw_objective()
+        objective_rect = self._draw_objective()
+        if objective_rect:
+            dirty_rects.append(objective_rect)
         
         # 残り時間表示
-        self._draw_timer()
+        dirty_rects.append(self._draw_timer())
         
         # 通知システム
-        self._draw_notifications()
+        dirty_rects.extend(self._draw_notifications())
+        
+        return dirty_rects
     
-    def _draw_quick_slots(self):
+    def _draw_quick_slots(self) -> List[pygame.Rect]:
         """救出されたペットを表示（クイックスロット枠を使用）"""
         for i, rect in enumerate(self.quick_slot_rects):
             # スロット背景
@@ -252,6 +258,8 @@ class GameUI:
                 str(i + 1), "default", int(12 * self.ui_scale), (200, 200, 200)
             )
             self.screen.blit(num_surface, (rect.x + 2, rect.y + 2))
+        
+        return self.quick_slot_rects
     
     def _draw_pet_fallback_icon(self, rect: pygame.Rect, pet_type_str: str):
         """ペット画像のフォールバック表示（円アイコン）"""
@@ -272,10 +280,10 @@ class GameUI:
         pygame.draw.circle(self.screen, color, (center_x, center_y), radius)
         pygame.draw.circle(self.screen, (255, 255, 255), (center_x, center_y), radius, 2)
     
-    def _draw_objective(self):
+    def _draw_objective(self) -> Optional[pygame.Rect]:
         """現在の目標を描画"""
         if not self.current_objective:
-            return
+            return None
         
         # 目標パネル背景
         panel_surface = pygame.Surface((self.objective_rect.width, self.objective_rect.height), 
@@ -323,12 +331,15 @@ class GameUI:
             text_x = progress_bar_rect.centerx - progress_surface.get_width() // 2
             text_y = progress_bar_rect.centery - progress_surface.get_height() // 2
             self.screen.blit(progress_surface, (text_x, text_y))
+        
+        return self.objective_rect
     
-    def _draw_notifications(self):
+    def _draw_notifications(self) -> List[pygame.Rect]:
         """通知を描画（左下に表示）"""
         notification_height = int(40 * self.ui_scale)
         notification_width = int(300 * self.ui_scale)
         margin = int(20 * self.ui_scale)
+        notification_rects = []
         
         # 左下から上に向かって表示
         for i, notification in enumerate(self.notifications):
@@ -366,9 +377,12 @@ class GameUI:
             
             text_x = notification_rect.x + 10
             text_y = notification_rect.centery - text_surface.get_height() // 2
-            self.screen.blit(text_surface, (text_x, text_y))
+            text_rect = self.screen.blit(text_surface, (text_x, text_y))
+            notification_rects.append(notification_rect.union(text_rect))
+        
+        return notification_rects
     
-    def _draw_timer(self):
+    def _draw_timer(self) -> pygame.Rect:
         """残り時間を描画"""
         # タイマーシステムから残り時間を取得
         if hasattr(self, 'timer_system') and self.timer_system:
@@ -413,6 +427,8 @@ class GameUI:
         label_text = label_font.render(get_text("time_remaining"), True, text_color)
         label_rect = label_text.get_rect(centerx=timer_bg_rect.centerx, bottom=timer_bg_rect.top - 5)
         self.screen.blit(label_text, label_rect)
+        
+        return timer_bg_rect.union(label_rect)
     
     def add_rescued_pet(self, pet_name: str, pet_type: str):
         """救出されたペットを追加"""
@@ -5,6 +5,7 @@
 
 import pygame
 import os
+import threading
 from typing import Dict, Optional, Tuple, List
 from pathlib import Path
 import json
@@ -21,6 +22,8 @@ class AssetManager:
         self.images: Dict[str, pygame.Surface] = {}
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
         self.fonts: Dict[str, pygame.font.Font] = {}
+        # 画素形式の変換が済んでいない画像のパス（変換はメインスレッドでのみ行う）
+        self._unconverted: set = set()
         
         # Web環境チェック
         self.is_web = self._check_web_environment()
@@ -99,6 +102,8 @@ class AssetManager:
         
         # キャッシュチェック
         if path in self.images:
+            if path in self._unconverted and self._on_main_thread():
+                self._convert_cached(path)
             return self.images[path]
         
         def _load_image_safe():
@@ -142,11 +147,34 @@ class AssetManager:
             print(f"⚠️ プレースホルダー画像を使用: {path}")
             image = self._create_placeholder_image(scale or self.default_scale)
         
-        # キャッシュに保存（最適化済み）
+        # キャッシュに保存（画素形式の変換はメインスレッドで最初に使うときに行う）
         if image:
             self.images[path] = image
+            self._unconverted.add(path)
+            if self._on_main_thread():
+                self._convert_cached(path)
         
-        return image
+        return self.images.get(path, image)
+    
+    def _on_main_thread(self) -> bool:
+        """メインスレッドから呼ばれているか"""
+        return threading.current_thread() is threading.main_thread()
+    
+    def _convert_cached(self, path: str):
+        """キャッシュ済み画像をディスプレイの画素形式に変換（blit毎の形式変換を避ける）"""
+        if pygame.display.get_surface() is None:
+            return
+        image = self.images[path]
+        if image.get_flags() & pygame.SRCALPHA:
+            self.images[path] = image.convert_alpha()
+        else:
+            self.images[path] = image.convert()
+        self._unconverted.discard(path)
+    
+    def convert_loaded_images(self):
+        """バックグラウンドで読み込んだ未変換の画像をまとめて変換（メインスレッドから呼ぶ）"""
+        for path in list(self._unconverted):
+            self._convert_cached(path)
     
     def _create_placeholder_image(self, size: Tuple[int, int]) -> pygame.Surface:
         """プレースホルダー画像を作成（エラーハンドリング付き）"""
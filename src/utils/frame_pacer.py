@@ -0,0 +1,49 @@
+"""
+フレームペーサー
+固定FPSでのフレーム待機とフレーム時間の計測（time.monotonic_ns基準）
+"""
+
+import os
+import time
+
+import pygame
+
+# 残り1ms未満の待機はスピンで合わせる（sched_yieldがあればCPUを譲る）
+_sched_yield = getattr(os, 'sched_yield', None)
+
+class FramePacer:
+    """固定FPSのフレームタイミング管理クラス"""
+
+    def __init__(self, fps: int):
+        self.frame_ns = 1_000_000_000 // fps
+        self.reset()
+
+    def reset(self) -> None:
+        """基準時刻を現在にリセット（停止・復帰時に停止時間をフレーム時間へ含めない）"""
+        self.next_frame_ns = time.monotonic_ns()
+        self.last_frame_ns = self.next_frame_ns
+
+    def advance(self) -> int:
+        """次フレームの予定時刻を進め、それまでの残り時間（ns）を返す（非同期ループ用）"""
+        self.next_frame_ns += self.frame_ns
+        now = time.monotonic_ns()
+        if now - self.next_frame_ns > self.frame_ns:
+            # 1フレーム以上遅れた場合は追い上げずに基準をリセット
+            self.next_frame_ns = now
+        return self.next_frame_ns - now
+
+    def wait(self) -> None:
+        """次フレームの予定時刻まで待機（同期ループ用）"""
+        remaining = self.advance()
+        if remaining > 2_000_000:
+            pygame.time.wait((remaining - 1_000_000) // 1_000_000)
+        while time.monotonic_ns() < self.next_frame_ns:
+            if _sched_yield:
+                _sched_yield()
+
+    def delta(self) -> float:
+        """前フレームからの経過時間（秒）を取得"""
+        now = time.monotonic_ns()
+        time_delta = (now - self.last_frame_ns) / 1_000_000_000
+        self.last_frame_ns = now
+        return time_delta
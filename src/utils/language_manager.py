@@ -4,6 +4,7 @@
 
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Any
 from enum import Enum
 
@@ -18,10 +19,15 @@ class LanguageManager:
     def __init__(self):
         self.current_language = Language.ENGLISH  # デフォルトは英語
         self.translations: Dict[str, Dict[str, str]] = {}
+        
+        # (言語コード, キー) ごとの翻訳結果キャッシュ
+        self._cached_text = lru_cache(maxsize=256)(self._lookup_text)
         self._load_translations()
     
     def _load_translations(self):
         """翻訳データを読み込み"""
+        self._cached_text.cache_clear()
+        
         # 基本的な翻訳データを直接定義
         self.translations = {
             Language.ENGLISH.value: {
@@ -225,7 +231,10 @@ class LanguageManager:
     
     def get_text(self, key: str) -> str:
         """指定されたキーの翻訳テキストを取得"""
-        lang_code = self.current_language.value
+        return self._cached_text(self.current_language.value, key)
+    
+    def _lookup_text(self, lang_code: str, key: str) -> str:
+        """翻訳テキストを検索（フォールバック込み）"""
         if lang_code in self.translations and key in self.translations[lang_code]:
             return self.translations[lang_code][key]
         
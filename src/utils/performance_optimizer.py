@@ -230,11 +230,17 @@ def optimize_surface(surface: pygame.Surface) -> pygame.Surface:
     # 画像をそのまま返す
     return surface
 
+# Surface.fblitsはpygame 2.4.0以降で利用可能
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
 def batch_blit(surface: pygame.Surface, blits: List[Tuple[pygame.Surface, Tuple[int, int]]]):
     """バッチ描画（複数の描画を一度に実行）"""
     if len(blits) > 1:
-        # Pygameのblitsメソッドを使用（高速）
-        surface.blits(blits)
+        # fblits/blitsで1回の呼び出しにまとめる（描画範囲のリストは生成しない）
+        if _HAS_FBLITS:
+            surface.fblits(blits)
+        else:
+            surface.blits(blits, doreturn=False)
     elif len(blits) == 1:
         # 単一描画
         surface.blit(blits[0][0], blits[0][1])
@@ -0,0 +1,192 @@
+"""
+アニメーションシステムの単体テスト
+"""
+
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# プロジェクトルートをPythonパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# 画面なし環境でも動作するようダミードライバを使用
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.core.animation import (
+    AnimationManager, FadeAnimation, SlideAnimation, ParticleAnimation,
+    create_success_animation
+)
+
+@pytest.fixture(scope="module", autouse=True)
+def pygame_display():
+    """pygameとダミー画面を初期化"""
+    pygame.init()
+    screen = pygame.display.set_mode((320, 240))
+    return screen
+
+def make_surface(size=(10, 10), color=(255, 0, 0)):
+    """テスト用サーフェスを作成"""
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
+class TestAnimation:
+    """個別アニメーションのテスト"""
+    
+    def test_slide_collect_blits(self):
+        """スライドの描画位置が開始位置から終了位置へ進むテスト"""
+        surface = make_surface()
+        animation = SlideAnimation(surface, (0, 0), (100, 0), 1.0)
+        
+        assert animation.collect_blits() == [(surface, (0, 0))]
+        
+        animation.update(0.5)
+        (blit_surface, pos), = animation.collect_blits()
+        assert blit_surface is surface
+        assert 0 < pos[0] < 100
+        
+        assert animation.update(0.6) is False
+        assert animation.is_finished
+    
+    def test_fade_does_not_modify_caller_surface(self):
+        """フェードが既定で呼び出し元のサーフェスを書き換えないテスト"""
+        surface = make_surface()
+        surface.set_alpha(200)
+        animation = FadeAnimation(surface, (0, 0), 1.0, fade_in=True)
+        
+        animation.update(0.5)
+        
+        assert surface.get_alpha() == 200
+        (faded, _), = animation.collect_blits()
+        assert faded is not surface
+        assert faded.get_alpha() == 100
+    
+    def test_particle_collect_blits(self):
+        """パーティクルが個数分の描画を返し、時間経過で移動するテスト"""
+        animation = ParticleAnimation((50, 50), 1.0, particle_count=5)
+        initial = [pos for _, pos in animation.collect_blits()]
+        assert len(initial) == 5
+        
+        animation.update(0.25)
+        moved = [pos for _, pos in animation.collect_blits()]
+        assert len(moved) == 5
+        assert moved != initial
+    
+    def test_particle_sprite_tables_are_shared(self):
+        """同じ色・最大半径のパーティクルはフェード段階ごとのスプライト表を共有するテスト"""
+        colors = [(255, 0, 0), (0, 0, 255)]
+        # 個数が多いので使用色・最大半径（6）はほぼ確実に一致する
+        first = ParticleAnimation((0, 0), 1.0, particle_count=200, colors=colors)
+        second = ParticleAnimation((100, 100), 1.0, particle_count=200, colors=colors)
+        
+        assert first._sprites is second._sprites
+        other = ParticleAnimation((0, 0), 1.0, particle_count=200, colors=[(0, 255, 0)])
+        assert other._sprites is not first._sprites
+        assert len(other.collect_blits()) == 200
+    
+    def test_text_scale_frames_are_shared(self):
+        """同じ描画済みテキストの拡大フレームは共有され、描画座標のみ個別に計算されるテスト"""
+        first = create_success_animation((50, 50))[1]
+        second = create_success_animation((150, 100))[1]
+        
+        assert first._scaled_frames is second._scaled_frames
+        x, y = first._scaled_pos[-1]
+        assert second._scaled_pos[-1] == (x + 100, y + 50)
+
+class TestAnimationManager:
+    """アニメーション一括管理のテスト"""
+    
+    def test_update_all_advances_animations(self):
+        """update_allで全アニメーションの経過時間が進むテスト"""
+        manager = AnimationManager()
+        short = SlideAnimation(make_surface(), (0, 0), (10, 0), 0.5)
+        long = SlideAnimation(make_surface(), (0, 0), (10, 0), 2.0)
+        manager.extend([short, long])
+        assert len(manager) == 2
+        
+        manager.update_all(0.25)
+        
+        assert short.elapsed_time == pytest.approx(0.25)
+        assert long.elapsed_time == pytest.approx(0.25)
+        assert not short.is_finished
+        assert len(manager) == 2
+    
+    def test_finished_animations_are_skipped_and_pruned(self):
+        """終了したアニメーションが描画対象から外れ、一定フレーム後に除去されるテスト"""
+        manager = AnimationManager()
+        short = SlideAnimation(make_surface(), (0, 0), (10, 0), 0.1)
+        long = SlideAnimation(make_surface(), (0, 0), (10, 0), 10.0)
+        manager.extend([short, long])
+        
+        manager.update_all(0.2)
+        
+        assert short.is_finished
+        assert len(manager) == 1
+        
+        for _ in range(AnimationManager.PRUNE_INTERVAL):
+            manager.update_all(0.0)
+        assert manager.animations == [long]
+    
+    def test_add_ignores_finished_animation(self):
+        """終了済みのアニメーションは追加されないテスト"""
+        manager = AnimationManager()
+        animation = SlideAnimation(make_surface(), (0, 0), (10, 0), 0.1)
+        animation.update(1.0)
+        
+        manager.add(animation)
+        
+        assert len(manager) == 0
+        assert manager.animations == []
+    
+    def test_draw_all(self, pygame_display):
+        """draw_allで継続中のアニメーションが描画されるテスト"""
+        target = pygame.Surface((100, 100))
+        target.fill((0, 0, 0))
+        manager = AnimationManager()
+        manager.add(SlideAnimation(make_surface(color=(0, 255, 0)), (20, 20), (20, 20), 1.0))
+        
+        manager.update_all(0.1)
+        manager.draw_all(target)
+        
+        assert target.get_at((25, 25))[:3] == (0, 255, 0)
+        assert target.get_at((5, 5))[:3] == (0, 0, 0)
+    
+    def test_draw_all_with_camera_offset(self, pygame_display):
+        """camera_offsetを渡すとワールド座標から画面座標に変換して描画されるテスト"""
+        target = pygame.Surface((100, 100))
+        target.fill((0, 0, 0))
+        manager = AnimationManager()
+        manager.add(SlideAnimation(make_surface(color=(0, 255, 0)), (520, 320), (520, 320), 1.0))
+        
+        manager.update_all(0.1)
+        manager.draw_all(target, (500, 300))
+        
+        assert target.get_at((25, 25))[:3] == (0, 255, 0)
+        assert target.get_at((5, 5))[:3] == (0, 0, 0)
+    
+    def test_success_animation_runs_to_completion(self, pygame_display):
+        """成功演出が描画され、時間経過で全て終了するテスト"""
+        manager = AnimationManager()
+        manager.extend(create_success_animation((160, 120)))
+        assert len(manager) == 2
+        
+        for _ in range(150):
+            manager.update_all(1 / 60)
+            manager.draw_all(pygame_display)
+        
+        assert len(manager) == 0
+    
+    def test_clear(self):
+        """clearで全アニメーションが破棄されるテスト"""
+        manager = AnimationManager()
+        manager.add(SlideAnimation(make_surface(), (0, 0), (10, 0), 1.0))
+        
+        manager.clear()
+        manager.update_all(0.1)
+        
+        assert len(manager) == 0
+        assert manager.animations == []
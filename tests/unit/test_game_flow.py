@@ -0,0 +1,105 @@
+"""
+ゲームフロー管理の単体テスト
+"""
+
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# プロジェクトルートをPythonパスに追加
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# 画面なし環境でも動作するようダミードライバを使用
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.core.game_flow import GameFlowManager, GameResult
+
+@pytest.fixture(scope="module")
+def screen():
+    """pygameとダミー画面を初期化"""
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    return screen
+
+@pytest.fixture
+def flow(screen, monkeypatch):
+    """ゲームフロー管理（タイマー設定は記録のみ）"""
+    monkeypatch.chdir(PROJECT_ROOT)
+    timers = []
+    monkeypatch.setattr(pygame.time, "set_timer", lambda *args: timers.append(args))
+    manager = GameFlowManager(screen)
+    manager.timers = timers
+    return manager
+
+class TestGameResult:
+    """ゲーム結果データのテスト"""
+    
+    def test_round_trip(self):
+        """to_dictとfrom_dictで同じ結果に戻るテスト"""
+        result = GameResult(pets_rescued=3, total_pets=4, time_taken=95.5, score=1200,
+                            victory=False, game_over=True, defeat_reason="time_up",
+                            remaining_time=0.0, player_lives=2, completion_rate=75.0)
+        
+        restored = GameResult.from_dict(result.to_dict())
+        
+        assert restored == result
+    
+    def test_from_dict_ignores_unknown_keys(self):
+        """未知のキーは無視され、欠けたキーは既定値になるテスト"""
+        result = GameResult.from_dict({"score": 500, "unknown": "value"})
+        
+        assert result.score == 500
+        assert result.total_pets == 4
+        assert "unknown" not in result.to_dict()
+    
+    def test_update_overwrites_given_fields(self):
+        """updateで指定したフィールドのみ上書きされるテスト"""
+        result = GameResult(score=100, pets_rescued=1)
+        
+        result.update({"score": 300, "victory": True})
+        
+        assert result.score == 300
+        assert result.victory is True
+        assert result.pets_rescued == 1
+
+class TestFinalizeFrame:
+    """フレーム末尾の救出集計のテスト"""
+    
+    def test_rescues_are_batched(self, flow):
+        """1フレーム内の救出通知がまとめて集計されるテスト"""
+        flow.notify_pet_rescued("pet_cat_001")
+        flow.notify_pet_rescued("pet_dog_001")
+        assert flow.game_result.pets_rescued == 0
+        
+        flow.finalize_frame()
+        
+        assert flow.game_result.pets_rescued == 2
+        assert flow.timers == []
+    
+    def test_no_rescues_is_noop(self, flow):
+        """救出通知がなければ何も変わらないテスト"""
+        flow.finalize_frame()
+        
+        assert flow.game_result.pets_rescued == 0
+        assert flow.timers == []
+    
+    def test_completion_timer_set_once(self, flow):
+        """全ペット救出時に結果画面移行タイマーが1回だけ設定されるテスト"""
+        flow.game_result.total_pets = 2
+        flow.notify_pet_rescued("pet_cat_001")
+        flow.notify_pet_rescued("pet_dog_001")
+        flow.finalize_frame()
+        
+        assert flow.timers == [(pygame.USEREVENT + 1, 2000)]
+        
+        # 救出数が上限を超えてもタイマーは再設定されない
+        flow.notify_pet_rescued("pet_rabbit_001")
+        flow.finalize_frame()
+        
+        assert flow.game_result.pets_rescued == 3
+        assert len(flow.timers) == 1
@@ -0,0 +1,212 @@
+"""
+メニューシステムの単体テスト
+"""
+
+import json
+import os
+import pytest
+import sys
+import threading
+from pathlib import Path
+
+# プロジェクトルートをPythonパスに追加
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# 画面なし環境でも動作するようダミードライバを使用
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import src.core.menu_system as menu_system
+from src.core.menu_system import MenuSystem, MenuState
+
+@pytest.fixture(scope="module")
+def screen():
+    """pygameとダミー画面を初期化"""
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    return screen
+
+@pytest.fixture
+def menu(screen, monkeypatch):
+    """メニューシステム（アセット・設定はプロジェクトルートから読み込む）"""
+    monkeypatch.chdir(PROJECT_ROOT)
+    menu = MenuSystem(screen)
+    yield menu
+    # 保存予約が残っていれば破棄（プロジェクトの設定ファイルを書き換えない）
+    if menu._save_timer is not None:
+        menu._save_timer.cancel()
+
+class TestMenuSystemSetup:
+    """メニューシステム初期化のテスト"""
+    
+    def test_construction(self, menu):
+        """全メニュー画面が作成され、描画できるテスト"""
+        for state in (MenuState.TITLE, MenuState.SETTINGS, MenuState.PAUSE,
+                      MenuState.PET_COLLECTION, MenuState.SAVE_LOAD):
+            assert menu.menus[state]
+            assert all(button.rect for button in menu.menus[state])
+        
+        assert menu.current_state == MenuState.TITLE
+        menu.draw()
+        assert not menu.needs_redraw()
+    
+    def test_button_change_invalidates_cache(self, menu):
+        """ボタンのテキスト変更で再描画が必要になるテスト"""
+        menu.draw()
+        menu.menus[MenuState.TITLE][0].text = "変更後"
+        
+        assert menu.needs_redraw()
+        assert not menu._blit_cache
+
+class TestMenuInput:
+    """メニュー入力のテスト"""
+    
+    def test_button_index_at(self, menu):
+        """座標からボタン番号を求める判定がボタン矩形と一致するテスト"""
+        buttons = menu.menus[MenuState.TITLE]
+        for i, button in enumerate(buttons):
+            assert menu._button_index_at(button.rect.center) == i
+            assert menu._button_index_at(button.rect.topleft) == i
+            assert menu._button_index_at((button.rect.right - 1, button.rect.bottom - 1)) == i
+            # ボタン間の隙間・左右の外側
+            assert menu._button_index_at((button.rect.centerx, button.rect.bottom)) is None
+            assert menu._button_index_at((button.rect.left - 1, button.rect.centery)) is None
+            assert menu._button_index_at((button.rect.right, button.rect.centery)) is None
+        
+        assert menu._button_index_at((buttons[0].rect.centerx, buttons[0].rect.top - 1)) is None
+        assert menu._button_index_at((buttons[-1].rect.centerx, buttons[-1].rect.bottom + 100)) is None
+    
+    def test_key_actions_default(self, menu):
+        """標準キーが各操作に割り当てられるテスト"""
+        actions = menu._key_actions
+        
+        assert actions[pygame.K_UP] == menu._on_up_key
+        assert actions[pygame.K_DOWN] == menu._on_down_key
+        assert actions[pygame.K_RETURN] == menu._on_action_key
+        assert actions[pygame.K_ESCAPE] == menu._on_cancel_key
+    
+    def test_key_actions_priority(self, menu):
+        """同じキーが複数の操作に割り当てられた場合は上・下・決定・キャンセルの順で優先されるテスト"""
+        key_bindings = dict(menu.settings["key_bindings"])
+        key_bindings.update(up=pygame.K_RETURN, down=pygame.K_ESCAPE,
+                            action=pygame.K_a, cancel=pygame.K_a)
+        menu.settings["key_bindings"] = key_bindings
+        menu._refresh_keybinds()
+        actions = menu._key_actions
+        
+        assert actions[pygame.K_RETURN] == menu._on_up_key
+        assert actions[pygame.K_ESCAPE] == menu._on_down_key
+        assert actions[pygame.K_a] == menu._on_action_key
+    
+    def test_down_key_moves_selection(self, menu):
+        """下キーで次のボタンが選択され、末尾から先頭に戻るテスト"""
+        count = len(menu.menus[MenuState.TITLE])
+        
+        menu._handle_keyboard_input(pygame.K_DOWN)
+        assert menu.selected_button == 1
+        
+        menu.selected_button = count - 1
+        menu._handle_keyboard_input(pygame.K_DOWN)
+        assert menu.selected_button == 0
+
+class TestSettingsSave:
+    """設定保存のテスト"""
+    
+    @pytest.fixture
+    def writes(self, menu, tmp_path, monkeypatch):
+        """保存先を一時ディレクトリに切り替え、書き込み（一時ファイルの置き換え）を記録"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(MenuSystem, "SAVE_DELAY", 0.05)
+        replaced = []
+        original_replace = Path.replace
+        
+        def record_replace(path, target):
+            replaced.append((path.name, Path(target).name))
+            return original_replace(path, target)
+        
+        monkeypatch.setattr(Path, "replace", record_replace)
+        return replaced
+    
+    def test_changes_are_debounced(self, menu, writes, tmp_path):
+        """連続した設定変更が1回の書き込みにまとめられるテスト"""
+        menu._async_save = True
+        menu.update_setting("master_volume", 0.1)
+        menu.update_setting("music_volume", 0.2)
+        menu.update_setting("sfx_volume", 0.3)
+        timer = menu._save_timer
+        assert timer is not None
+        assert writes == []
+        
+        timer.join(5.0)
+        
+        assert writes == [("game_settings.json.tmp", "game_settings.json")]
+        saved = json.loads((tmp_path / "config" / "game_settings.json").read_text(encoding="utf-8"))
+        assert saved["master_volume"] == 0.1
+        assert saved["music_volume"] == 0.2
+        assert saved["sfx_volume"] == 0.3
+        assert not (tmp_path / "config" / "game_settings.json.tmp").exists()
+    
+    def test_cleanup_flushes_pending_save(self, menu, writes, tmp_path):
+        """終了時に保存予約を取り消し、その場で書き込むテスト"""
+        menu._async_save = True
+        menu.update_setting("master_volume", 0.4)
+        timer = menu._save_timer
+        
+        menu.cleanup()
+        timer.join(5.0)
+        
+        assert writes == [("game_settings.json.tmp", "game_settings.json")]
+        saved = json.loads((tmp_path / "config" / "game_settings.json").read_text(encoding="utf-8"))
+        assert saved["master_volume"] == 0.4
+    
+    def test_update_setting_does_not_wait_for_write(self, menu, writes, tmp_path, monkeypatch):
+        """ファイル書き込み中でも設定の更新が待たされないテスト"""
+        writing = threading.Event()
+        release = threading.Event()
+        original_write_bytes = Path.write_bytes
+        
+        def slow_write_bytes(path, data):
+            writing.set()
+            release.wait(5.0)
+            return original_write_bytes(path, data)
+        
+        monkeypatch.setattr(Path, "write_bytes", slow_write_bytes)
+        menu._async_save = True
+        menu.update_setting("master_volume", 0.1)
+        first_timer = menu._save_timer
+        assert writing.wait(5.0)
+        
+        updater = threading.Thread(target=menu.update_setting, args=("master_volume", 0.2))
+        updater.start()
+        updater.join(1.0)
+        assert not updater.is_alive()
+        second_timer = menu._save_timer
+        assert second_timer is not None and second_timer is not first_timer
+        
+        release.set()
+        first_timer.join(5.0)
+        second_timer.join(5.0)
+        
+        # 書き込み中の変更は次の保存で書き込まれる
+        assert len(writes) == 2
+        saved = json.loads((tmp_path / "config" / "game_settings.json").read_text(encoding="utf-8"))
+        assert saved["master_volume"] == 0.2
+    
+    def test_failed_write_keeps_existing_file(self, menu, writes, tmp_path, monkeypatch):
+        """一時ファイルへの書き込みに失敗しても既存の設定ファイルが壊れないテスト"""
+        settings_file = tmp_path / "config" / "game_settings.json"
+        settings_file.parent.mkdir()
+        settings_file.write_text('{"master_volume": 0.5}', encoding="utf-8")
+        
+        def failing_dumps(data):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(menu_system, "_json_dumps", failing_dumps)
+        menu._async_save = False
+        menu.update_setting("master_volume", 0.9)
+        
+        assert writes == []
+        assert json.loads(settings_file.read_text(encoding="utf-8")) == {"master_volume": 0.5}